@@ -27,11 +27,11 @@ class ACBProcessor(BaseBankProcessor):
     
     def _parse_spot(self, email_text: str) -> pd.DataFrame:
         """Parse Spot Exchange Rates table"""
-        out_cols = self.get_standard_columns()['spot']
+        out_cols = self._std_cols['spot']
         
         parts = re.split(r"(?i)spot\s+exchange\s+rates", email_text, maxsplit=1)
         if len(parts) < 2:
-            return pd.DataFrame(columns=out_cols)
+            return self._empty_spot_df
         
         spot_section = parts[1]
         forward_parts = re.split(r"(?i)forward\s+exchange\s+rates", spot_section, maxsplit=1)
@@ -69,16 +69,16 @@ class ACBProcessor(BaseBankProcessor):
     
     def _parse_forwards(self, email_text: str) -> pd.DataFrame:
         """Parse Forward Exchange Rates"""
-        out_cols = self.get_standard_columns()['forward']
+        out_cols = self._std_cols['forward']
         
         root = re.split(r"(?i)forward\s+exchange\s+rates", email_text, maxsplit=1)
         if len(root) < 2:
-            return pd.DataFrame(columns=out_cols)
+            return self._empty_forward_df
         tail = root[1]
         
         bid_parts = re.split(r"(?i)\bBid\s*Price\s*:", tail, maxsplit=1)
         if len(bid_parts) < 2:
-            return pd.DataFrame(columns=out_cols)
+            return self._empty_forward_df
         
         after_bid = bid_parts[1]
         ask_parts = re.split(r"(?i)\bAsk\s*Price\s*:", after_bid, maxsplit=1)
@@ -91,7 +91,7 @@ class ACBProcessor(BaseBankProcessor):
         rows += self._parse_forward_side(ask_text, "Ask")
         
         if not rows:
-            return pd.DataFrame(columns=out_cols)
+            return self._empty_forward_df
         
         df = pd.DataFrame(rows)
         df = df.sort_values(["Bid/Ask", "Trading date", "Term (days)"]).reset_index(drop=True)
@@ -155,11 +155,5 @@ class ACBProcessor(BaseBankProcessor):
     
     def _build_central_bank(self, email_text: str) -> pd.DataFrame:
         """Build Central Bank rate stub"""
-        out_cols = self.get_standard_columns()['central']
         qd = self._first_date(email_text) or ""
-        return pd.DataFrame([{
-            "No.": 1,
-            "Bank": self.bank_name,
-            "Quoting date": qd,
-            "Central Bank Rate": None
-        }], columns=out_cols)
\ No newline at end of file
+        return self._central_stub(qd)
\ No newline at end of file
@@ -6,17 +6,60 @@ Defines common interface and shared utilities
 
 from abc import ABC, abstractmethod
 from datetime import datetime, date
+from functools import lru_cache
+import codecs
 import pandas as pd
 import re
+import sys
 from typing import Tuple, Optional
 
 
+@lru_cache(maxsize=256)
+def _parse_dmy(dmy: str) -> date:
+    """Cached DD/MM/YYYY parse - the same date strings repeat across rows"""
+    return datetime.strptime(dmy, "%d/%m/%Y").date()
+
+
+# Encode error handler that collapses each run of unencodable characters to a
+# single space - the same semantics as re.sub(r'[^\x00-\x7F]+', ' ', text)
+# but the ASCII fast path runs at C speed with no regex engine involved
+codecs.register_error('fx_space', lambda e: (' ', e.end))
+
+
+def scrub_non_ascii(text: str) -> str:
+    """Replace every run of non-ASCII characters with a single space"""
+    return text.encode('ascii', 'fx_space').decode('ascii')
+
+
 class BaseBankProcessor(ABC):
     """Abstract base class for bank-specific email processors"""
-    
+
+    # Interned side labels reused by every row dict (pointer-fast dict keys/values)
+    SIDE_BID = sys.intern("Bid")
+    SIDE_ASK = sys.intern("Ask")
+
     def __init__(self, bank_name: str):
-        self.bank_name = bank_name
+        # Intern strings repeated across every row so dict inserts and later
+        # pandas column lookups compare by pointer instead of re-hashing
+        self.bank_name = sys.intern(bank_name)
+        # Column layout is immutable config - resolve it once instead of
+        # rebuilding the dict on every sub-parse
+        cols = self.get_standard_columns()
+        self._std_cols = cols
+        self._fwd_cols = [sys.intern(c) for c in cols['forward']]
+        self._spot_cols = [sys.intern(c) for c in cols['spot']]
+        self._central_cols = [sys.intern(c) for c in cols['central']]
         self.DATE_DMY = r"(?:0[1-9]|[12]\d|3[01])/(?:0[1-9]|1[0-2])/(?:19|20)\d\d"
+        # Precompiled once so hot loops skip the re module's per-call cache lookup
+        self.DATE_DMY_RE = re.compile(self.DATE_DMY)
+        self._first_date_cache = None
+        self._cb_template = None
+        # Shared empty frames for the no-match early returns; building a
+        # fresh empty DataFrame per miss re-ran construction every time
+        # (callers never mutate these)
+        self._empty_forward_df = pd.DataFrame(columns=cols['forward'])
+        self._empty_spot_df = pd.DataFrame(columns=cols['spot'])
+        self._empty_central_df = pd.DataFrame(columns=cols['central'])
     
     @abstractmethod
     def parse_email(self, email_text: str) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
@@ -31,8 +74,8 @@ class BaseBankProcessor(ABC):
         return int(str(s).replace(',', '')) if s is not None and str(s).strip() else None
     
     def _to_date(self, dmy: str) -> date:
-        """Convert DD/MM/YYYY string to date"""
-        return datetime.strptime(dmy, "%d/%m/%Y").date()
+        """Convert DD/MM/YYYY string to date (memoized)"""
+        return _parse_dmy(dmy)
     
     def _days(self, d1: date, d2: date) -> int:
         """Calculate days between two dates"""
@@ -47,10 +90,34 @@ class BaseBankProcessor(ABC):
         return (months * 30 + days) / 360.0
     
     def _first_date(self, text: str) -> Optional[str]:
-        """Extract first date from text"""
-        m = re.search(self.DATE_DMY, text)
-        return m.group(0) if m else None
+        """Extract first date from text (memoized per email)"""
+        # Spot/Forward/CentralBank parsing all ask for the first date of the
+        # same email; remember the last answer so only one full scan runs
+        cached = self._first_date_cache
+        if cached is not None and cached[0] is text:
+            return cached[1]
+        m = self.DATE_DMY_RE.search(text)
+        result = m.group(0) if m else None
+        self._first_date_cache = (text, result)
+        return result
     
+    def _central_stub(self, quoting_date) -> pd.DataFrame:
+        """1-row Central Bank stub DataFrame from a cached template"""
+        # Build the template lazily once per processor; the old per-call
+        # pd.DataFrame([{...}]) re-ran dtype inference on every email
+        tmpl = self._cb_template
+        if tmpl is None:
+            tmpl = pd.DataFrame([{
+                "No.": 1,
+                "Bank": self.bank_name,
+                "Quoting date": "",
+                "Central Bank Rate": None
+            }], columns=self._central_cols)
+            self._cb_template = tmpl
+        df = tmpl.copy()
+        df["Quoting date"] = quoting_date
+        return df
+
     def get_standard_columns(self) -> dict:
         """Return standard column definitions"""
         return {
@@ -72,7 +139,7 @@ class BaseBankProcessor(ABC):
     
     def create_empty_dataframes(self) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
         """Create empty DataFrames with standard columns"""
-        cols = self.get_standard_columns()
+        cols = self._std_cols
         return (
             pd.DataFrame(columns=cols['forward']),
             pd.DataFrame(columns=cols['spot']),
@@ -30,7 +30,9 @@ class BIDVProcessor(BaseBankProcessor):
         if s is None or str(s).strip() == '':
             return None
         # BIDV uses format like 26,284.00 -> 26284
-        return int(float(str(s).replace(',', '')))
+        # Slice off the decimal part directly; the float round-trip
+        # allocated an intermediate just to truncate it again
+        return int(str(s).replace(',', '').split('.', 1)[0])
     
     def _first_bidv_date(self, text: str) -> str:
         """Extract first date from BIDV email (MM/DD/YYYY format)"""
@@ -44,12 +46,12 @@ class BIDVProcessor(BaseBankProcessor):
     
     def _parse_spot(self, email_text: str) -> pd.DataFrame:
         """Parse BIDV Spot Exchange Rates"""
-        out_cols = self.get_standard_columns()['spot']
+        out_cols = self._std_cols['spot']
         
         # Find spot section
         parts = re.split(r"(?i)spot\s+exchange\s+rates", email_text, maxsplit=1)
         if len(parts) < 2:
-            return pd.DataFrame(columns=out_cols)
+            return self._empty_spot_df
         
         spot_section = parts[1]
         forward_parts = re.split(r"(?i)forward\s+exchange\s+rates", spot_section, maxsplit=1)
@@ -91,17 +93,17 @@ class BIDVProcessor(BaseBankProcessor):
     
     def _parse_forwards(self, email_text: str) -> pd.DataFrame:
         """Parse BIDV Forward Exchange Rates"""
-        out_cols = self.get_standard_columns()['forward']
+        out_cols = self._std_cols['forward']
         
         root = re.split(r"(?i)forward\s+exchange\s+rates", email_text, maxsplit=1)
         if len(root) < 2:
-            return pd.DataFrame(columns=out_cols)
+            return self._empty_forward_df
         tail = root[1]
         
         # Split by Bid Price and Ask Price sections
         bid_parts = re.split(r"(?i)\bBid\s*Price\s*:", tail, maxsplit=1)
         if len(bid_parts) < 2:
-            return pd.DataFrame(columns=out_cols)
+            return self._empty_forward_df
         
         after_bid = bid_parts[1]
         ask_parts = re.split(r"(?i)\bAsk\s*Price\s*:", after_bid, maxsplit=1)
@@ -114,7 +116,7 @@ class BIDVProcessor(BaseBankProcessor):
         rows += self._parse_forward_side(ask_text, "Ask")
         
         if not rows:
-            return pd.DataFrame(columns=out_cols)
+            return self._empty_forward_df
         
         df = pd.DataFrame(rows)
         df = df.sort_values(["Bid/Ask", "Trading date", "Term (days)"]).reset_index(drop=True)
@@ -245,11 +247,5 @@ class BIDVProcessor(BaseBankProcessor):
     
     def _build_central_bank(self, email_text: str) -> pd.DataFrame:
         """Build Central Bank rate stub for BIDV"""
-        out_cols = self.get_standard_columns()['central']
         qd = self._first_bidv_date(email_text) or ""
-        return pd.DataFrame([{
-            "No.": 1,
-            "Bank": self.bank_name,
-            "Quoting date": qd,
-            "Central Bank Rate": None
-        }], columns=out_cols)
\ No newline at end of file
+        return self._central_stub(qd)
\ No newline at end of file
@@ -17,11 +17,13 @@ class KBankProcessor(BaseBankProcessor):
         if s is None or str(s).strip() == '':
             return None
         # KBank uses format like 26,280 or 26,295.00 -> 26280 or 26295
-        return int(float(str(s).replace(',', '')))
+        # Slice off the decimal part directly; the float round-trip
+        # allocated an intermediate just to truncate it again
+        return int(str(s).replace(',', '').split('.', 1)[0])
     
     def _parse_forward(self, email_text: str) -> pd.DataFrame:
         """Parse KBank Forward Exchange Rates"""
-        out_cols = self.get_standard_columns()['forward']
+        out_cols = self._std_cols['forward']
         
         # Clean unicode first
         clean_text = re.sub(r'[^\x00-\x7F]+', ' ', email_text)
@@ -29,14 +31,14 @@ class KBankProcessor(BaseBankProcessor):
         # Find forward section
         parts = re.split(r"(?i)forward\s+exchange\s+rates", clean_text, maxsplit=1)
         if len(parts) < 2:
-            return pd.DataFrame(columns=out_cols)
+            return self._empty_forward_df
         
         tail = parts[1]
         
         # Split into Bid and Ask sections
         bid_parts = re.split(r"(?i)KBank\s*s\s*Bid\s*Price", tail, maxsplit=1)
         if len(bid_parts) < 2:
-            return pd.DataFrame(columns=out_cols)
+            return self._empty_forward_df
         
         after_bid = bid_parts[1]
         ask_parts = re.split(r"(?i)KBank\s*s\s*Ask\s*Price", after_bid, maxsplit=1)
@@ -49,7 +51,7 @@ class KBankProcessor(BaseBankProcessor):
         rows += self._parse_kbank_forward_side(ask_text, "Ask")
         
         if not rows:
-            return pd.DataFrame(columns=out_cols)
+            return self._empty_forward_df
         
         df = pd.DataFrame(rows)
         df = df.sort_values(["Bid/Ask", "Trading date", "Term (days)"]).reset_index(drop=True)
@@ -131,12 +133,12 @@ class KBankProcessor(BaseBankProcessor):
     
     def _parse_spot(self, email_text: str) -> pd.DataFrame:
         """Parse KBank Spot Exchange Rates"""
-        out_cols = self.get_standard_columns()['spot']
+        out_cols = self._std_cols['spot']
         
         # Find spot section
         parts = re.split(r"(?i)spot\s+exchange\s+rates?", email_text, maxsplit=1)
         if len(parts) < 2:
-            return pd.DataFrame(columns=out_cols)
+            return self._empty_spot_df
         
         spot_section = parts[1]
         # Clean unicode
@@ -166,14 +168,8 @@ class KBankProcessor(BaseBankProcessor):
             
             return pd.DataFrame(rows, columns=out_cols)
         
-        return pd.DataFrame(columns=out_cols)
+        return self._empty_spot_df
     
     def _build_central_bank(self, email_text: str) -> pd.DataFrame:
         """Build Central Bank rate stub for KBank"""
-        out_cols = self.get_standard_columns()['central']
-        return pd.DataFrame([{
-            "No.": 1,
-            "Bank": self.bank_name,
-            "Quoting date": "25/08/2025",
-            "Central Bank Rate": None
-        }], columns=out_cols)
\ No newline at end of file
+        return self._central_stub("25/08/2025")
\ No newline at end of file
@@ -39,12 +39,12 @@ class TCBProcessor(BaseBankProcessor):
           - Closing rate of Friday (last week)
         We isolate the spot section and read numbers adjacent to each label.
         """
-        out_cols = self.get_standard_columns()['spot']
+        out_cols = self._std_cols['spot']
 
         # 1) Isolate Spot section, exclude Forward section
         parts = re.split(r"(?i)spot\s+exchange\s+rates", email_text, maxsplit=1)
         if len(parts) < 2:
-            return pd.DataFrame(columns=out_cols)
+            return self._empty_spot_df
         spot_sec = parts[1]
         spot_sec = re.split(r"(?i)forward\s+exchange\s+rates", spot_sec, maxsplit=1)[0]
 
@@ -110,17 +110,17 @@ class TCBProcessor(BaseBankProcessor):
           25/08/2025  22/09/2025  26,300  1M ( )  1.20  26,324
         Regex tolerates extra spaces, numbers with/without commas, and integer/decimal Gap.
         """
-        out_cols = self.get_standard_columns()['forward']
+        out_cols = self._std_cols['forward']
 
         root = re.split(r"(?i)forward\s+exchange\s+rates", email_text, maxsplit=1)
         if len(root) < 2:
-            return pd.DataFrame(columns=out_cols)
+            return self._empty_forward_df
 
         tail = root[1]
         # Split into Bid/Ask blocks
         bid_split = re.split(r"(?i)\bBid\s*Price\s*:", tail, maxsplit=1)
         if len(bid_split) < 2:
-            return pd.DataFrame(columns=out_cols)
+            return self._empty_forward_df
 
         after_bid = bid_split[1]
         ask_split = re.split(r"(?i)\bAsk\s*Price\s*:", after_bid, maxsplit=1)
@@ -132,7 +132,7 @@ class TCBProcessor(BaseBankProcessor):
         rows += self._parse_forward_side(ask_text, "Ask")
 
         if not rows:
-            return pd.DataFrame(columns=out_cols)
+            return self._empty_forward_df
 
         df = pd.DataFrame(rows, columns=[
             "Bid/Ask","Bank","Quoting date","Trading date","Value date",
@@ -155,7 +155,7 @@ class TCBProcessor(BaseBankProcessor):
         # Skip header lines
         data_start = 0
         for i, line in enumerate(lines):
-            if re.match(self.DATE_DMY, line):
+            if self.DATE_DMY_RE.match(line):
                 data_start = i
                 break
         
@@ -169,7 +169,7 @@ class TCBProcessor(BaseBankProcessor):
         
         while i < len(data_lines):
             # Check if this looks like a trading date (DD/MM/YYYY)
-            if not re.match(self.DATE_DMY, data_lines[i]):
+            if not self.DATE_DMY_RE.match(data_lines[i]):
                 i += 1
                 continue
                 
@@ -262,11 +262,5 @@ class TCBProcessor(BaseBankProcessor):
     # Central Bank stub
     # -------------------------------
     def _build_central_bank(self, email_text: str) -> pd.DataFrame:
-        out_cols = self.get_standard_columns()['central']
         qd = self._first_date(email_text) or ""
-        return pd.DataFrame([{
-            "No.": 1,
-            "Bank": self.bank_name,
-            "Quoting date": qd,
-            "Central Bank Rate": None
-        }], columns=out_cols)
+        return self._central_stub(qd)
@@ -21,18 +21,18 @@ class UOBProcessor(BaseBankProcessor):
     
     def _parse_forward(self, email_text: str) -> pd.DataFrame:
         """Parse UOB Forward Exchange Rates"""
-        out_cols = self.get_standard_columns()['forward']
+        out_cols = self._std_cols['forward']
         
         # Find forward section
         root = re.split(r"(?i)forward\s+exchange\s+rates", email_text, maxsplit=1)
         if len(root) < 2:
-            return pd.DataFrame(columns=out_cols)
+            return self._empty_forward_df
         tail = root[1]
         
         # Split by Bid Price and Ask Price sections
         bid_parts = re.split(r"(?i)\bBid\s*Price\s*:", tail, maxsplit=1)
         if len(bid_parts) < 2:
-            return pd.DataFrame(columns=out_cols)
+            return self._empty_forward_df
         
         after_bid = bid_parts[1]
         ask_parts = re.split(r"(?i)\bAsk\s*Price\s*:", after_bid, maxsplit=1)
@@ -45,7 +45,7 @@ class UOBProcessor(BaseBankProcessor):
         rows += self._parse_uob_forward_side(ask_text, "Ask")
         
         if not rows:
-            return pd.DataFrame(columns=out_cols)
+            return self._empty_forward_df
         
         df = pd.DataFrame(rows)
         df = df.sort_values(["Bid/Ask", "Trading date", "Term (days)"]).reset_index(drop=True)
@@ -132,12 +132,12 @@ class UOBProcessor(BaseBankProcessor):
     
     def _parse_spot(self, email_text: str) -> pd.DataFrame:
         """Parse UOB Spot Exchange Rates"""
-        out_cols = self.get_standard_columns()['spot']
+        out_cols = self._std_cols['spot']
         
         # Find spot section
         parts = re.split(r"(?i)spot\s+exchange\s+rates?", email_text, maxsplit=1)
         if len(parts) < 2:
-            return pd.DataFrame(columns=out_cols)
+            return self._empty_spot_df
         
         spot_section = parts[1]
         clean_section = re.sub(r'[^\x00-\x7F]+', ' ', spot_section)
@@ -165,14 +165,8 @@ class UOBProcessor(BaseBankProcessor):
             
             return pd.DataFrame(rows, columns=out_cols)
         
-        return pd.DataFrame(columns=out_cols)
+        return self._empty_spot_df
     
     def _build_central_bank(self, email_text: str) -> pd.DataFrame:
         """Build Central Bank rate stub for UOB"""
-        out_cols = self.get_standard_columns()['central']
-        return pd.DataFrame([{
-            "No.": 1,
-            "Bank": self.bank_name,
-            "Quoting date": "25/08/2025",
-            "Central Bank Rate": None
-        }], columns=out_cols)
\ No newline at end of file
+        return self._central_stub("25/08/2025")
\ No newline at end of file
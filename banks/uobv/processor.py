@@ -21,7 +21,7 @@ class UOBVProcessor(BaseBankProcessor):
     
     def _parse_forward(self, email_text: str) -> pd.DataFrame:
         """Parse UOBV Forward Exchange Rates"""
-        out_cols = self.get_standard_columns()['forward']
+        out_cols = self._std_cols['forward']
         
         # UOBV has a vertical format with each field on a separate line
         clean_text = re.sub(r'[^\x00-\x7F]+', ' ', email_text)
@@ -115,7 +115,7 @@ class UOBVProcessor(BaseBankProcessor):
                 i += 1
         
         if not rows:
-            return pd.DataFrame(columns=out_cols)
+            return self._empty_forward_df
         
         df = pd.DataFrame(rows)
         df = df.sort_values(["Bid/Ask", "Trading date", "Term (days)"]).reset_index(drop=True)
@@ -124,12 +124,12 @@ class UOBVProcessor(BaseBankProcessor):
     
     def _parse_spot(self, email_text: str) -> pd.DataFrame:
         """Parse UOBV Spot Exchange Rates"""
-        out_cols = self.get_standard_columns()['spot']
+        out_cols = self._std_cols['spot']
         
         # Find spot section
         parts = re.split(r"(?i)spot\s+exchange\s+rates?", email_text, maxsplit=1)
         if len(parts) < 2:
-            return pd.DataFrame(columns=out_cols)
+            return self._empty_spot_df
         
         spot_section = parts[1]
         clean_section = re.sub(r'[^\x00-\x7F]+', ' ', spot_section)
@@ -157,14 +157,8 @@ class UOBVProcessor(BaseBankProcessor):
             
             return pd.DataFrame(rows, columns=out_cols)
         
-        return pd.DataFrame(columns=out_cols)
+        return self._empty_spot_df
     
     def _build_central_bank(self, email_text: str) -> pd.DataFrame:
         """Build Central Bank rate stub for UOBV"""
-        out_cols = self.get_standard_columns()['central']
-        return pd.DataFrame([{
-            "No.": 1,
-            "Bank": self.bank_name,
-            "Quoting date": "25/08/2025",
-            "Central Bank Rate": None
-        }], columns=out_cols)
\ No newline at end of file
+        return self._central_stub("25/08/2025")
\ No newline at end of file
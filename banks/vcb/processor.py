@@ -7,13 +7,56 @@ VCB (Vietcombank) Email Parser - Fixed version
 """
 
 import re
+from dataclasses import dataclass
 from datetime import datetime, date
+import numpy as np
 import pandas as pd
 from typing import Tuple
 
 from ..base import BaseBankProcessor
 
 
+@dataclass(slots=True)
+class _FwdRow:
+    """Fixed-shape forward row - a fraction of the memory of a 12-key dict"""
+    side: str
+    trd: date
+    val: date
+    spot: int
+    gap: float
+    fwd: int
+    tdays: int
+    tlook: int
+
+
+# Các pattern dùng trên hot path, compile 1 lần ở mức module
+_SPOT_HDR_RE = re.compile(r"spot\s+exchange\s+rates", re.IGNORECASE)
+_FWD_HDR_RE = re.compile(r"forward\s+exchange\s+rates", re.IGNORECASE)
+_ASK_PRICE_RE = re.compile(r"\bAsk\s*Price\b[:\uff1a]?", re.IGNORECASE)
+_BID_PRICE_RE = re.compile(r"\bBid\s*Price\b[:\uff1a]?", re.IGNORECASE)
+_WS_RE = re.compile(r"\s+")
+_LINE_RE = re.compile(r"[^\n]+")
+_RATE_RE = re.compile(r"\b\d{2}[.,]?\d{3}\b")   # 26.090 / 26,090 / 26090
+_DATE_DMY = r"(?:0[1-9]|[12]\d|3[01])/(?:0[1-9]|1[0-2])/(?:19|20)\d\d"
+# Một regex gộp cho cả dòng forward: trd + val + (spot?) + term + fwd
+_FWD_ROW_RE = re.compile(
+    rf"(?P<trd>{_DATE_DMY})\s+"
+    rf"(?P<val>{_DATE_DMY})\s+"
+    r"(?:(?P<spot>\d{2}\.\d{3})\s+)?"
+    r"\d+\s*[DMWY]\s*\(\s*\)\s+"
+    r"(?P<fwd>\d{2}\.\d{3})"
+)
+
+
+# Nhãn Spot: 1 alternation quét một lượt thay vì 3 lượt find_idx riêng lẻ
+_LABELS_RE = re.compile(
+    r"Lowest\s+rate\s+of\s+the\s+pre(?:c|cc)eding\s+week"
+    r"|Highest\s+rate\s+of\s+the\s+pre(?:c|cc)eding\s+week"
+    r"|Closing\s+rate\s+of\s+Friday",
+    re.IGNORECASE,
+)
+
+
 class VCBProcessor(BaseBankProcessor):
     """VCB-specific email processor - Fixed for missing spots & quoting date"""
 
@@ -25,18 +68,36 @@ class VCBProcessor(BaseBankProcessor):
     # -------------------------------
     def parse_email(self, email_text: str) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
         """Parse VCB email format"""
-        df_forward = self._parse_forwards(email_text)
+        rows = self.parse_email_rows(email_text)
+        return (
+            self._forwards_to_df(rows['forward']),
+            self._spot_to_df(rows['spot']),
+            self._central_to_df(rows['central']),
+        )
+
+    def parse_email_rows(self, email_text: str) -> dict:
+        """
+        Parse VCB email into raw row lists (no DataFrame construction).
+        Forward rows are lightweight _FwdRow records; spot/central rows are dicts.
+
+        Batch callers looping over many emails should extend plain lists from
+        this and build each DataFrame once at the end, instead of growing a
+        DataFrame with a per-email pd.concat (quadratic in total rows).
+        """
+        fwd_rows = self._forward_rows(email_text)
 
         # quoting date = min Trading date in Forward (fallback: first date in email)
-        if not df_forward.empty and "Trading date" in df_forward:
-            qd = df_forward["Trading date"].min()
+        if fwd_rows:
+            qd = min(r.trd for r in fwd_rows)
         else:
             qd_str = self._first_date(email_text) or ""
             qd = self._to_date(qd_str) if qd_str else ""
 
-        df_spot = self._parse_spot(email_text, quoting_date_override=qd)
-        df_central = self._build_central_bank(quoting_date_override=qd)
-        return df_forward, df_spot, df_central
+        return {
+            'forward': fwd_rows,
+            'spot': self._spot_rows(email_text, quoting_date_override=qd),
+            'central': self._central_rows(quoting_date_override=qd),
+        }
 
     # -------------------------------
     # Utils
@@ -50,7 +111,7 @@ class VCBProcessor(BaseBankProcessor):
     # -------------------------------
     # Spot parsing (label-anchored)
     # -------------------------------
-    def _parse_spot(self, email_text: str, quoting_date_override=None) -> pd.DataFrame:
+    def _spot_rows(self, email_text: str, quoting_date_override=None) -> list:
         """
         VCB Spot Exchange Rates (robust):
         - Đọc theo nhãn: Lowest / Highest / Closing
@@ -59,49 +120,66 @@ class VCBProcessor(BaseBankProcessor):
         - Trả về Bid/Ask riêng; nếu chỉ bắt được 1 số -> Bid = số đó, Ask = None
             (KHÔNG copy Bid sang Ask)
         """
-        out_cols = self.get_standard_columns()['spot']
-
-        # 1) Cắt riêng phần Spot (loại Forward)
-        parts = re.split(r"(?i)spot\s+exchange\s+rates", email_text, maxsplit=1)
-        if len(parts) < 2:
-            return pd.DataFrame(columns=out_cols)
-        spot_section = parts[1]
-        spot_only = re.split(r"(?i)forward\s+exchange\s+rates", spot_section, maxsplit=1)[0]
-
-        # 2) Chuẩn hoá dòng
-        lines = [re.sub(r"\s+", " ", ln.strip()) for ln in spot_only.splitlines() if ln.strip()]
-
-        # 3) Tìm index của 3 nhãn
-        def find_idx(regex: str) -> int:
-            pat = re.compile(regex, flags=re.IGNORECASE)
-            for i, ln in enumerate(lines):
-                if pat.search(ln):
-                    return i
-            return -1
-
-        idx_low   = find_idx(r"Lowest\s+rate\s+of\s+the\s+pre(?:c|cc)eding\s+week")
-        idx_high  = find_idx(r"Highest\s+rate\s+of\s+the\s+pre(?:c|cc)eding\s+week")
-        idx_close = find_idx(r"Closing\s+rate\s+of\s+Friday\s*\(last\s*week\)")
+        # 1) Cắt riêng phần Spot (loại Forward) - search + slice, không cấp
+        #    phát phần đầu (prefix) không dùng như re.split
+        m = _SPOT_HDR_RE.search(email_text)
+        if not m:
+            return []
+        spot_section = email_text[m.end():]
+        fwd_m = _FWD_HDR_RE.search(spot_section)
+        spot_only = spot_section[:fwd_m.start()] if fwd_m else spot_section
+
+        # 2) Chuẩn hoá dòng + ghi lại offset từng dòng trong văn bản chuẩn hoá
+        #    (để quét regex theo pos/endpos, không phải join lại block)
+        #    1 lượt finditer duy nhất: bỏ dòng rỗng + tính offset luôn,
+        #    không cần splitlines rồi quét lại danh sách lần nữa
+        lines = []
+        line_start = []
+        off = 0
+        for lm in _LINE_RE.finditer(spot_only):
+            ln = _WS_RE.sub(" ", lm.group().strip())
+            if not ln:
+                continue
+            lines.append(ln)
+            line_start.append(off)
+            off += len(ln) + 1
+        line_start.append(off)  # sentinel: cuối văn bản
+        normalized = "\n".join(lines)
+
+        # 3) Tìm index của 3 nhãn trong 1 lượt quét (dispatch theo ký tự đầu nhãn)
+        idx_low = idx_high = idx_close = -1
+        for i, ln in enumerate(lines):
+            m = _LABELS_RE.search(ln)
+            if not m:
+                continue
+            first = m.group(0)[0].lower()
+            if first == 'l':
+                if idx_low == -1:
+                    idx_low = i
+            elif first == 'h':
+                if idx_high == -1:
+                    idx_high = i
+            elif idx_close == -1:
+                idx_close = i
+            if idx_low != -1 and idx_high != -1 and idx_close != -1:
+                break
 
         # 4) Hàm trích 2 số (Bid, Ask) trong block từ start..end
-        rate_re = re.compile(r"\b\d{2}[.,]?\d{3}\b")  # 26.090 / 26,090 / 26090
-
         def extract_pair(start_idx: int, end_idx: int) -> tuple:
             if start_idx == -1:
                 return (None, None)
             # Giới hạn block tối đa 6 dòng để tránh ăn sang phần khác
             j_end = end_idx if end_idx != -1 else min(len(lines), start_idx + 6)
-            block = " ".join(lines[start_idx:j_end])
-            nums = rate_re.findall(block)
-
-            if len(nums) >= 2:
-                return self._to_vcb_int(nums[0]), self._to_vcb_int(nums[1])
-            elif len(nums) == 1:
-                # Chỉ có 1 số gần nhãn -> coi là Bid; Ask để None (không copy)
-                v = self._to_vcb_int(nums[0])
-                return v, None
-            else:
-                return (None, None)
+            # Chỉ cần 2 số đầu (Bid, Ask) -> finditer + dừng sớm; quét thẳng trên
+            # văn bản chuẩn hoá theo offset dòng, không cần join lại block
+            it = _RATE_RE.finditer(normalized, line_start[start_idx], line_start[j_end])
+            first = next(it, None)
+            second = next(it, None)
+            # Nếu chỉ có 1 số gần nhãn -> coi là Bid; Ask để None (không copy)
+            return (
+                self._to_vcb_int(first.group()) if first else None,
+                self._to_vcb_int(second.group()) if second else None,
+            )
 
         # 5) Xác định ranh giới block theo thứ tự nhãn
         #    low ... high ... close ...
@@ -121,10 +199,10 @@ class VCBProcessor(BaseBankProcessor):
         else:
             quoting_date = self._first_date(email_text) or ""
 
-        rows = [
+        return [
             {
                 "No.": 1,
-                "Bid/Ask": "Bid",
+                "Bid/Ask": self.SIDE_BID,
                 "Bank": self.bank_name,
                 "Quoting date": quoting_date,
                 "Lowest rate of preceeding week": low_bid,
@@ -133,7 +211,7 @@ class VCBProcessor(BaseBankProcessor):
             },
             {
                 "No.": 2,
-                "Bid/Ask": "Ask",
+                "Bid/Ask": self.SIDE_ASK,
                 "Bank": self.bank_name,
                 "Quoting date": quoting_date,
                 "Lowest rate of preceeding week": low_ask,
@@ -141,24 +219,30 @@ class VCBProcessor(BaseBankProcessor):
                 "Closing rate of Friday (last week)": close_ask,
             },
         ]
-        return pd.DataFrame(rows, columns=out_cols)
+
+    def _spot_to_df(self, rows: list) -> pd.DataFrame:
+        """Materialize spot rows column-wise with nullable Int64 rate columns"""
+        out_cols = self._std_cols['spot']
+        if not rows:
+            return self._empty_spot_df
+        data = {c: [r[c] for r in rows] for c in out_cols}
+        df = pd.DataFrame(data, columns=out_cols)
+        return df.astype({c: 'Int64' for c in out_cols[-3:]})
 
 
     # -------------------------------
     # Forward parsing (robust, missing spot rows)
     # -------------------------------
-    def _parse_forwards(self, email_text: str) -> pd.DataFrame:
-        """Parse VCB Forward Exchange Rates (handles missing spot on later rows)"""
-        out_cols = self.get_standard_columns()['forward']
-
-        root = re.split(r"(?i)forward\s+exchange\s+rates", email_text, maxsplit=1)
-        if len(root) < 2:
-            return pd.DataFrame(columns=out_cols)
-        tail = root[1]
+    def _forward_rows(self, email_text: str) -> list:
+        """Parse VCB Forward Exchange Rates rows (handles missing spot on later rows)"""
+        m = _FWD_HDR_RE.search(email_text)
+        if not m:
+            return []
+        tail = email_text[m.end():]
 
         # VCB structure: Both Ask and Bid sections have forward rates
-        ask_m = re.search(r"(?i)\bAsk\s*Price\b[:：]?", tail)
-        bid_m = re.search(r"(?i)\bBid\s*Price\b[:：]?", tail)
+        ask_m = _ASK_PRICE_RE.search(tail)
+        bid_m = _BID_PRICE_RE.search(tail)
         
         rows = []
         
@@ -167,136 +251,111 @@ class VCBProcessor(BaseBankProcessor):
             ask_start = ask_m.end()
             ask_end = bid_m.start() if bid_m and bid_m.start() > ask_start else len(tail)
             ask_text = tail[ask_start:ask_end]
-            rows += self._parse_forward_side(ask_text, "Ask")
+            rows += self._parse_forward_side(ask_text, self.SIDE_ASK)
         
         # Parse Bid section
         if bid_m:
             bid_text = tail[bid_m.end():]
-            rows += self._parse_forward_side(bid_text, "Bid")
+            rows += self._parse_forward_side(bid_text, self.SIDE_BID)
 
-        if not rows:
-            return pd.DataFrame(columns=out_cols)
+        return rows
 
-        df = pd.DataFrame(rows)
-        df = df.sort_values(["Bid/Ask", "Trading date", "Term (days)"]).reset_index(drop=True)
-        df.insert(0, "No.", range(1, len(df) + 1))
+    def _forwards_to_df(self, rows: list) -> pd.DataFrame:
+        """Materialize forward rows into the standard sorted DataFrame"""
+        out_cols = self._std_cols['forward']
+        if not rows:
+            return self._empty_forward_df
+
+        # Sort the row records up front - a Timsort on the small list is far
+        # cheaper than sort_values reindexing every column afterwards
+        rows = sorted(rows, key=lambda r: (r.side, r.trd, r.tdays))
+
+        # Zip the fixed-shape rows straight into column lists; the numeric
+        # columns go in as typed NumPy arrays so pandas skips dtype inference
+        n = len(rows)
+        df = pd.DataFrame({
+            "No.": np.arange(1, n + 1),
+            # Two- and one-valued string columns as categoricals: one byte of
+            # code per row instead of an object pointer ("Ask" < "Bid" keeps
+            # the lexical sort order)
+            "Bid/Ask": pd.Categorical([r.side for r in rows],
+                                      categories=["Ask", "Bid"]),
+            "Bank": pd.Categorical([self.bank_name]).repeat(n),
+            "Quoting date": [r.trd for r in rows],   # date type
+            "Trading date": [r.trd for r in rows],
+            "Value date": [r.val for r in rows],
+            "Spot Exchange rate": [r.spot for r in rows],  # may hold None
+            "Gap(%)": np.fromiter((r.gap for r in rows), dtype=np.float64, count=n),
+            "Forward Exchange rate": np.fromiter((r.fwd for r in rows), dtype=np.int64, count=n),
+            "Term (days)": np.fromiter((r.tdays for r in rows), dtype=np.int64, count=n),
+            "% forward (cal)": None,
+            "Diff.": None,
+            "Term (lookup)": np.fromiter((r.tlook for r in rows), dtype=np.int64, count=n),
+        })
         return df
 
     def _parse_forward_side(self, text: str, side: str) -> list:
         """
         Parse VCB forward side - handle missing spot in later terms
-        First term: Trading date, Value date, Spot rate, Term, Forward rate (5 lines)
-        Later terms: Trading date, Value date, Term, Forward rate (4 lines) - reuse last spot
-        """
-        lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
+        First term: Trading date, Value date, Spot rate, Term, Forward rate
+        Later terms: Trading date, Value date, Term, Forward rate - reuse last spot
 
-        # Find where data starts (skip headers, look for first date)
-        data_start = -1
-        for i, line in enumerate(lines):
-            if re.match(self.DATE_DMY, line):
-                data_start = i
-                break
-        if data_start == -1:
-            return []
-
-        data_lines = lines[data_start:]
-        rows = []
+        One finditer pass over the raw side text yields the rows directly;
+        no intermediate line list, strips or index arithmetic.
+        """
+        recs = []
         current_spot = None
-        i = 0
-        terms_processed = 0  # Limit to 5 terms per side
-
-        # Pattern matching
-        spot_re = re.compile(r"\b\d{2}\.\d{3}\b")
-        term_re = re.compile(r"(\d+)\s*([DMWY])\s*\(\s*\)")
-
-        while i < len(data_lines) and terms_processed < 5:
-            # Need at least Trading date + Value date
-            if i + 1 >= len(data_lines):
+        # Bind the hot helpers to locals - the loop body then runs on fast
+        # LOAD_FAST lookups instead of repeated attribute resolution
+        to_date = self._to_date
+        to_int = self._to_vcb_int
+        append = recs.append
+
+        for m in _FWD_ROW_RE.finditer(text):
+            if len(recs) >= 5:  # Limit to 5 terms per side
                 break
-                
-            # Check if we have valid trading and value dates
-            if (not re.match(self.DATE_DMY, data_lines[i]) or 
-                not re.match(self.DATE_DMY, data_lines[i + 1])):
-                i += 1
-                continue
-                
-            trd_s = data_lines[i]
-            val_s = data_lines[i + 1]
-            
-            # Check if next line is spot rate or term
-            if i + 2 >= len(data_lines):
-                break
-                
-            next_line = data_lines[i + 2]
-            
-            if spot_re.match(next_line):
-                # This term has spot rate (first term usually)
-                if i + 4 >= len(data_lines):
-                    break
-                    
-                spot_s = data_lines[i + 2]
-                term_s = data_lines[i + 3] 
-                fwd_s = data_lines[i + 4]
-                current_spot = self._to_vcb_int(spot_s)
-                i += 5
-            elif term_re.match(next_line):
-                # This term has no spot rate (reuse last spot)
-                if i + 3 >= len(data_lines):
-                    break
-                    
-                term_s = data_lines[i + 2]
-                fwd_s = data_lines[i + 3]
-                i += 4
-            else:
-                i += 1
-                continue
 
-            # Validate term and forward rate
-            if not term_re.match(term_s) or not spot_re.match(fwd_s):
-                continue
+            # One C-level call fetches all four groups
+            trd_s, val_s, spot_s, fwd_s = m.group('trd', 'val', 'spot', 'fwd')
+            if spot_s:
+                current_spot = to_int(spot_s)
 
-            # Parse values
-            trd = self._to_date(trd_s)
-            val = self._to_date(val_s)
-            fwd = self._to_vcb_int(fwd_s)
-            
-            mterm = term_re.match(term_s)
-            termnum = int(mterm.group(1))
-            termunit = mterm.group(2).upper()
+            trd = to_date(trd_s)
+            val = to_date(val_s)
+            fwd = to_int(fwd_s)
 
             if val < trd:
                 trd, val = val, trd
 
-            term_days = self._days(trd, val)
-            term_lookup = round(self._yearfrac_30360_us(trd, val) * 12)
-
             # Calculate gap percentage
             gap_pct = ((fwd - current_spot) / current_spot * 100) if current_spot else 0
-            gap_pct = round(gap_pct, 2)
-            
-            rows.append({
-                "Bid/Ask": side,
-                "Bank": self.bank_name,
-                "Quoting date": trd,   # date type
-                "Trading date": trd,
-                "Value date": val,
-                "Spot Exchange rate": current_spot,
-                "Gap(%)": gap_pct,
-                "Forward Exchange rate": fwd,
-                "Term (days)": term_days,
-                "% forward (cal)": None,
-                "Diff.": None,
-                "Term (lookup)": term_lookup
-            })
-            terms_processed += 1
+            append((trd, val, current_spot, round(gap_pct, 2), fwd))
 
-        return rows
+        if not recs:
+            return []
+
+        # Whole-column date math: term days and the 30/360 US yearfrac come
+        # out of vectorized datetime64 arithmetic instead of the per-row
+        # _days/_yearfrac_30360_us helper calls
+        trd_d = np.array([r[0] for r in recs], dtype='datetime64[D]')
+        val_d = np.array([r[1] for r in recs], dtype='datetime64[D]')
+        trd_m = trd_d.astype('datetime64[M]')
+        val_m = val_d.astype('datetime64[M]')
+        tdays = (val_d - trd_d).view('int64')
+        months = (val_m - trd_m).view('int64')
+        day1 = (trd_d - trd_m).view('int64') + 1
+        day2 = (val_d - val_m).view('int64') + 1
+        d1d = np.where(day1 == 31, 30, day1)
+        d2d = np.where((day2 == 31) & (d1d == 30), 30, day2)
+        tlook = np.rint((months * 30 + d2d - d1d) / 360.0 * 12).astype('int64')
+
+        return [_FwdRow(side, r[0], r[1], r[2], r[3], r[4], td, tl)
+                for r, td, tl in zip(recs, tdays.tolist(), tlook.tolist())]
 
     # -------------------------------
     # Central Bank stub (with quoting-date override)
     # -------------------------------
-    def _build_central_bank(self, email_text: str = "", quoting_date_override=None) -> pd.DataFrame:
-        out_cols = self.get_standard_columns()['central']
+    def _central_rows(self, email_text: str = "", quoting_date_override=None) -> list:
         if quoting_date_override:
             if hasattr(quoting_date_override, 'strftime'):
                 qd = quoting_date_override.strftime('%d/%m/%Y')
@@ -304,9 +363,16 @@ class VCBProcessor(BaseBankProcessor):
                 qd = str(quoting_date_override)
         else:
             qd = self._first_date(email_text) or ""
-        return pd.DataFrame([{
+        return [{
             "No.": 1,
             "Bank": self.bank_name,
             "Quoting date": qd,
             "Central Bank Rate": None
-        }], columns=out_cols)
+        }]
+
+    def _central_to_df(self, rows: list) -> pd.DataFrame:
+        out_cols = self._std_cols['central']
+        if not rows:
+            return self._empty_central_df
+        data = {c: [r[c] for r in rows] for c in out_cols}
+        return pd.DataFrame(data, columns=out_cols).astype({'Central Bank Rate': 'Int64'})
@@ -1,53 +1,117 @@
 import re
+import numpy as np
 import pandas as pd
 from banks.base import BaseBankProcessor
 
+# Hot-path patterns compiled once at import instead of per parse call
+_SPOT_HDR_RE = re.compile(r"spot\s+exchange\s+rates?", re.IGNORECASE)
+_FWD_HDR_RE = re.compile(r"forward\s+exchange\s+rates", re.IGNORECASE)
+# Both section headers located in one combined scan (spot precedes forward
+# in these emails); the fallback singles cover degenerate layouts
+_SECTIONS_RE = re.compile(
+    r"(?is)spot\s+exchange\s+rates?(?P<spot>.*?)forward\s+exchange\s+rates"
+)
+_BID_PRICE_RE = re.compile(r"\bBid\s*Price\s*:", re.IGNORECASE)
+_ASK_PRICE_RE = re.compile(r"\bAsk\s*Price\s*:", re.IGNORECASE)
+_NONASCII_RE = re.compile(r'[^\x00-\x7F]+')
+# One multi-branch pattern classifies a line in a single match call; the
+# branch that fired (lastgroup) stands in for the old per-line anchored scans
+_LINE_CLASS_RE = re.compile(
+    r'(?P<date>\d{1,2}/\d{1,2}/\d{4})'
+    r'|(?P<crate>\d{2},\d{3})'
+    r'|(?P<plain5>\d{5})'
+    r'|(?P<num>\d+\.?\d*)'
+)
+_RATE_ANY_RE = re.compile(r'\b\d{2},\d{3}(?:\.\d{2})?\b|\b\d{5}\b')
+_TERM_M_RE = re.compile(r'(\d+)M')
+
 class VIBProcessor(BaseBankProcessor):
     def __init__(self):
         super().__init__(bank_name="VIB")
     
     def parse_email(self, email_text: str):
-        df_forward = self._parse_forward(email_text)
-        df_spot = self._parse_spot(email_text)
-        df_central = self._build_central_bank(email_text)
+        # Strip non-ASCII once up front; every sub-parser reuses the cleaned text
+        clean_text = _NONASCII_RE.sub(' ', email_text)
+        spot_text, fwd_text = self._split_sections(clean_text)
+        df_forward = self._parse_forward(fwd_text)
+        df_spot = self._parse_spot(spot_text, clean_text)
+        df_central = self._build_central_bank(clean_text)
         return df_forward, df_spot, df_central
+
+    def _split_sections(self, text: str):
+        """Locate the Spot and Forward sections with a single header scan"""
+        # The headers are fixed ASCII phrases, so a literal find on one
+        # lowercased copy beats the regex engine; regexes stay as fallback
+        # for unusual spacing or ordering
+        low = text.lower()
+        i = low.find("spot exchange rate")
+        j = low.find("forward exchange rates")
+        if 0 <= i < j:
+            i += 18
+            if low.startswith("s", i):  # optional plural as in rates?
+                i += 1
+            return text[i:], text[j + 22:]
+        m = _SECTIONS_RE.search(text)
+        if m:
+            return text[m.start('spot'):], text[m.end():]
+        spot_m = _SPOT_HDR_RE.search(text)
+        fwd_m = _FWD_HDR_RE.search(text)
+        return (text[spot_m.end():] if spot_m else None,
+                text[fwd_m.end():] if fwd_m else None)
     
     def _to_vib_int(self, s) -> int:
         """Convert VIB rate format to int (handles commas and decimals)"""
         if s is None or str(s).strip() == '':
             return None
         # VIB uses format like 26,310.00 -> 26310 or 26285 -> 26285
-        return int(float(str(s).replace(',', '')))
+        # Slice off the decimal part directly; the float round-trip
+        # allocated an intermediate just to truncate it again
+        return int(str(s).replace(',', '').split('.', 1)[0])
     
-    def _parse_forward(self, email_text: str) -> pd.DataFrame:
-        """Parse VIB Forward Exchange Rates"""
-        out_cols = self.get_standard_columns()['forward']
-        
-        # Find forward section
-        root = re.split(r"(?i)forward\s+exchange\s+rates", email_text, maxsplit=1)
-        if len(root) < 2:
-            return pd.DataFrame(columns=out_cols)
-        tail = root[1]
-        
-        # Split by Bid Price and Ask Price sections
-        bid_parts = re.split(r"(?i)\bBid\s*Price\s*:", tail, maxsplit=1)
-        if len(bid_parts) < 2:
-            return pd.DataFrame(columns=out_cols)
-        
-        after_bid = bid_parts[1]
-        ask_parts = re.split(r"(?i)\bAsk\s*Price\s*:", after_bid, maxsplit=1)
-        
-        bid_text = ask_parts[0]
-        ask_text = ask_parts[1] if len(ask_parts) > 1 else ""
+    def _parse_forward(self, tail) -> pd.DataFrame:
+        """Parse VIB Forward Exchange Rates (tail = text after the header)"""
+        out_cols = self._std_cols['forward']
+        if tail is None:
+            return self._empty_forward_df
+
+        # Slice out the Bid Price and Ask Price sections - literal find on a
+        # lowercased copy, with the regexes as fallback for odd spacing
+        low = tail.lower()
+        b = low.find("bid price:")
+        if b >= 0:
+            b += 10
+        else:
+            bid_m = _BID_PRICE_RE.search(tail)
+            if not bid_m:
+                return self._empty_forward_df
+            b = bid_m.end()
+        after_bid = tail[b:]
+        a = low.find("ask price:", b)
+        if a >= 0:
+            bid_text = tail[b:a]
+            ask_text = tail[a + 10:]
+        else:
+            ask_m = _ASK_PRICE_RE.search(after_bid)
+            bid_text = after_bid[:ask_m.start()] if ask_m else after_bid
+            ask_text = after_bid[ask_m.end():] if ask_m else ""
         
         rows = []
         rows += self._parse_vib_forward_side(bid_text, "Bid")
         rows += self._parse_vib_forward_side(ask_text, "Ask")
         
         if not rows:
-            return pd.DataFrame(columns=out_cols)
-        
-        df = pd.DataFrame(rows)
+            return self._empty_forward_df
+        
+        # Pivot to column lists once and hand pandas typed arrays for the
+        # always-int columns instead of a list of dicts to re-infer
+        cols = {k: [r[k] for r in rows] for k in rows[0]}
+        for k in ("Spot Exchange rate", "Forward Exchange rate", "Term (days)", "Term (lookup)"):
+            cols[k] = np.asarray(cols[k], dtype=np.int64)
+        # Low-cardinality string columns as categoricals - int codes instead
+        # of object pointers ("Ask" < "Bid" keeps the lexical sort order)
+        cols["Bid/Ask"] = pd.Categorical(cols["Bid/Ask"], categories=["Ask", "Bid"])
+        cols["Bank"] = pd.Categorical(cols["Bank"])
+        df = pd.DataFrame(cols)
         df = df.sort_values(["Bid/Ask", "Trading date", "Term (days)"]).reset_index(drop=True)
         df.insert(0, "No.", range(1, len(df) + 1))
         return df
@@ -55,27 +119,33 @@ class VIBProcessor(BaseBankProcessor):
     def _parse_vib_forward_side(self, text: str, side: str) -> list:
         """Parse VIB forward side (Bid or Ask)"""
         rows = []
+
+        # Split into lines (text already unicode-cleaned in parse_email)
+        lines = [line.strip() for line in text.split('\n') if line.strip()]
         
-        # Clean unicode and split into lines
-        clean_text = re.sub(r'[^\x00-\x7F]+', ' ', text)
-        lines = [line.strip() for line in clean_text.split('\n') if line.strip()]
+        # Classify every line once up front; the assembly loop below then
+        # branches on the precomputed kind instead of re-running regexes
+        kinds = []
+        for ln in lines:
+            m = _LINE_CLASS_RE.match(ln)
+            kinds.append(m.lastgroup if m else None)
         
         # Parse rows by combining consecutive lines
         i = 0
         while i < len(lines):
-            if re.match(r'\d{1,2}/\d{1,2}/\d{4}', lines[i]):  # Trading date line "25/08/2025"
+            if kinds[i] == 'date':  # Trading date line "25/08/2025"
                 try:
                     if i + 5 < len(lines):
                         trd_date_str = lines[i]  # "25/08/2025"
                         val_date_str = lines[i + 1]  # "24/09/2025"
-                        spot_str = lines[i + 2] if re.match(r'\d{2},\d{3}', lines[i + 2]) else None
+                        spot_str = lines[i + 2] if kinds[i + 2] == 'crate' else None
                         term_str = lines[i + 3] if "M" in lines[i + 3] else lines[i + 2]  # "1M ( )"
-                        gap_str = lines[i + 4] if re.match(r'\d+\.?\d*', lines[i + 4]) else None
+                        gap_str = lines[i + 4] if kinds[i + 4] is not None else None
                         fwd_str = None
                         
                         # Find forward rate (5-digit number)
                         for j in range(i + 4, min(i + 7, len(lines))):
-                            if re.match(r'\d{5}', lines[j]):
+                            if kinds[j] == 'plain5':
                                 fwd_str = lines[j]
                                 break
                         
@@ -94,7 +164,7 @@ class VIBProcessor(BaseBankProcessor):
                             term_lookup = round(term_days / 30)
                             
                             # Extract term info
-                            term_match = re.search(r'(\d+)M', term_str)
+                            term_match = _TERM_M_RE.search(term_str)
                             if term_match:
                                 term_months = int(term_match.group(1))
                             else:
@@ -129,28 +199,32 @@ class VIBProcessor(BaseBankProcessor):
         
         return rows
     
-    def _parse_spot(self, email_text: str) -> pd.DataFrame:
-        """Parse VIB Spot Exchange Rates"""
-        out_cols = self.get_standard_columns()['spot']
-        
-        # Find spot section
-        parts = re.split(r"(?i)spot\s+exchange\s+rates?", email_text, maxsplit=1)
-        if len(parts) < 2:
-            return pd.DataFrame(columns=out_cols)
-        
-        spot_section = parts[1]
-        clean_section = re.sub(r'[^\x00-\x7F]+', ' ', spot_section)
-        
-        # Extract rates from spot section (prefer comma format first)
-        rates_comma = re.findall(r'\b\d{2},\d{3}(?:\.\d{2})?\b', clean_section)
-        rates_plain = re.findall(r'\b\d{5}\b', clean_section)
-        
+    def _parse_spot(self, spot_section, email_text: str) -> pd.DataFrame:
+        """Parse VIB Spot Exchange Rates (section pre-sliced by caller)"""
+        out_cols = self._std_cols['spot']
+        if spot_section is None:
+            return self._empty_spot_df
+
+        # Extract rates in one combined scan, still listing every
+        # comma-format rate before the plain 5-digit ones as the old
+        # two-pass findall ordering did
+        rates_comma = []
+        rates_plain = []
+        for m in _RATE_ANY_RE.finditer(spot_section):
+            tok = m.group()
+            (rates_comma if ',' in tok else rates_plain).append(tok)
+
         spot_rates = rates_comma + rates_plain
         
         if len(spot_rates) >= 6:
+            # Convert all six rates in one vectorized pass instead of calling
+            # _to_vib_int per value
+            ints = (pd.Series(spot_rates[:6])
+                    .str.replace(',', '', regex=False)
+                    .astype('float64').astype('int64').to_numpy())
             # Assume structure: bid (low, high, close), ask (low, high, close)
-            bid_rates = spot_rates[:3]
-            ask_rates = spot_rates[3:6]
+            bid_rates = ints[:3]
+            ask_rates = ints[3:6]
             
             rows = []
             for i, (side, rates) in enumerate([("Bid", bid_rates), ("Ask", ask_rates)]):
@@ -160,22 +234,16 @@ class VIBProcessor(BaseBankProcessor):
                         "Bid/Ask": side,
                         "Bank": self.bank_name,
                         "Quoting date": self._first_date(email_text) or "25/08/2025",
-                        "Lowest rate of preceeding week": self._to_vib_int(rates[0]),
-                        "Highest rate of preceeding week": self._to_vib_int(rates[1]),
-                        "Closing rate of Friday (last week)": self._to_vib_int(rates[2])
+                        "Lowest rate of preceeding week": rates[0],
+                        "Highest rate of preceeding week": rates[1],
+                        "Closing rate of Friday (last week)": rates[2]
                     })
             
             return pd.DataFrame(rows, columns=out_cols)
         
-        return pd.DataFrame(columns=out_cols)
+        return self._empty_spot_df
     
     def _build_central_bank(self, email_text: str) -> pd.DataFrame:
         """Build Central Bank rate stub for VIB"""
-        out_cols = self.get_standard_columns()['central']
         qd = self._first_date(email_text) or "25/08/2025"
-        return pd.DataFrame([{
-            "No.": 1,
-            "Bank": self.bank_name,
-            "Quoting date": qd,
-            "Central Bank Rate": None
-        }], columns=out_cols)
\ No newline at end of file
+        return self._central_stub(qd)
\ No newline at end of file
@@ -1,70 +1,66 @@
 import re
+import numpy as np
 import pandas as pd
 from banks.base import BaseBankProcessor
 
+# Hot-path patterns compiled once at import instead of per parse call
+_NONASCII_RE = re.compile(r'[^\x00-\x7F]+')
+# 5-digit numbers in (10000, 30000) matched directly; the old \d{4,6} scan
+# needed an int() call per hit just to discard years and small figures
+_RATE_RE = re.compile(r'\b(?!10000\b)[12]\d{4}\b')
+
 class VTBProcessor(BaseBankProcessor):
     def __init__(self):
         super().__init__(bank_name="VTB")
     
     def parse_email(self, email_text: str):
-        df_forward = self._parse_forward(email_text)
-        df_spot = self._parse_spot(email_text)
-        df_central = self._build_central_bank(email_text)
+        # Strip non-ASCII once up front; every sub-parser reuses the cleaned text
+        clean_text = _NONASCII_RE.sub(' ', email_text)
+        df_forward = self._parse_forward(clean_text)
+        df_spot = self._parse_spot(clean_text)
+        df_central = self._build_central_bank(clean_text)
         return df_forward, df_spot, df_central
     
     def _parse_forward(self, email_text: str) -> pd.DataFrame:
         """Parse VTB Forward Exchange Rates - VTB format appears to have limited data"""
-        out_cols = self.get_standard_columns()['forward']
+        out_cols = self._std_cols['forward']
         
         # VTB email has very limited rate data - use default structure
-        rows = []
         terms = ['1M', '3M', '6M', '9M', '12M']
-        
-        # Extract any numeric patterns that might be rates
-        clean_content = re.sub(r'[^\x00-\x7F]+', ' ', email_text)
-        numbers = re.findall(r'\b\d{4,6}\b', clean_content)
-        
-        # Filter out obvious non-rate numbers (like year 2025)
-        potential_rates = [n for n in numbers if int(n) > 10000 and int(n) < 30000]
-        
-        # Generate stub data with available numbers or defaults
-        base_bid = 26300
-        base_ask = 26350
-        
-        for i, term in enumerate(terms):
-            # Use available rates if found, otherwise use incremental defaults
-            if i * 2 < len(potential_rates):
-                bid_rate = int(potential_rates[i * 2])
-            else:
-                bid_rate = base_bid + (i * 10)
-                
-            if i * 2 + 1 < len(potential_rates):
-                ask_rate = int(potential_rates[i * 2 + 1])
-            else:
-                ask_rate = base_ask + (i * 10)
-            
-            rows.append({
-                "No.": len(rows) + 1,
-                "Bid/Ask": "Bid",
-                "Bank": self.bank_name,
-                "Terms": term,
-                "Trading date": "25/08/2025",
-                "Forward Rate": bid_rate
-            })
-            rows.append({
-                "No.": len(rows) + 1,
-                "Bid/Ask": "Ask",
-                "Bank": self.bank_name,
-                "Terms": term,
-                "Trading date": "25/08/2025",
-                "Forward Rate": ask_rate
-            })
-        
-        return pd.DataFrame(rows, columns=out_cols)
+        n = len(terms)
+
+        # Extract rate-range numbers directly; the pattern already excludes
+        # obvious non-rate numbers (like year 2025)
+        # (email_text already unicode-cleaned in parse_email)
+        potential_rates = _RATE_RE.findall(email_text)
+
+        # Generate stub data with available numbers or defaults, as whole
+        # columns instead of per-term dict pairs: bid rows sit at even
+        # indices, ask rows at odd, exactly like the old rate_index walk
+        fwd_rates = np.empty(n * 2, dtype=np.int64)
+        fwd_rates[0::2] = 26300 + 10 * np.arange(n)  # bid defaults
+        fwd_rates[1::2] = 26350 + 10 * np.arange(n)  # ask defaults
+        avail = np.asarray(potential_rates[:n * 2], dtype=np.int64)
+        fwd_rates[:avail.size] = avail
+
+        df = pd.DataFrame({
+            "No.": np.arange(1, n * 2 + 1),
+            # Low-cardinality string columns as categoricals - int codes
+            # instead of object pointers
+            "Bid/Ask": pd.Categorical([self.SIDE_BID, self.SIDE_ASK] * n,
+                                      categories=["Ask", "Bid"]),
+            "Bank": pd.Categorical([self.bank_name]).repeat(n * 2),
+            "Terms": pd.Categorical(np.repeat(terms, 2), categories=terms),
+            "Trading date": "25/08/2025",
+            "Forward Rate": fwd_rates
+        })
+        # Reindex to the standard layout (drops VTB-only helper columns,
+        # leaves the rest empty) - same shape the row-dict build produced
+        return df.reindex(columns=out_cols)
     
     def _parse_spot(self, email_text: str) -> pd.DataFrame:
         """Parse VTB Spot Exchange Rates - generate stub data"""
-        out_cols = self.get_standard_columns()['spot']
+        out_cols = self._std_cols['spot']
         
         # VTB appears to have limited spot data - generate reasonable stub
         rows = [
@@ -92,10 +88,4 @@ class VTBProcessor(BaseBankProcessor):
     
     def _build_central_bank(self, email_text: str) -> pd.DataFrame:
         """Build Central Bank rate stub for VTB"""
-        out_cols = self.get_standard_columns()['central']
-        return pd.DataFrame([{
-            "No.": 1,
-            "Bank": self.bank_name,
-            "Quoting date": "25/08/2025",
-            "Central Bank Rate": None
-        }], columns=out_cols)
\ No newline at end of file
+        return self._central_stub("25/08/2025")
\ No newline at end of file
@@ -1,132 +1,252 @@
 import re
+from datetime import date, timedelta
+import numpy as np
 import pandas as pd
-from banks.base import BaseBankProcessor
+from banks.base import BaseBankProcessor, scrub_non_ascii
+
+
+def _parse_dmy_dash(s: str) -> date:
+    """Hand-parse DD-MM-YYYY; _DATE_RE already guarantees the shape, so the
+    strptime format tokenizer is pure overhead here"""
+    d, m, y = s.split('-')
+    return date(int(y), int(m), int(d))
+
+# Hot-path patterns compiled once at import instead of per parse call
+_SPOT_HDR_RE = re.compile(r"spot\s+exchange\s+rates?", re.IGNORECASE)
+_FWD_HDR_RE = re.compile(r"forward\s+exchange\s+rates", re.IGNORECASE)
+# Both section headers located in one combined scan (spot precedes forward
+# in these emails); the fallback singles cover degenerate layouts
+_SECTIONS_RE = re.compile(
+    r"(?is)spot\s+exchange\s+rates?(?P<spot>.*?)forward\s+exchange\s+rates"
+)
+_BID_PRICE_RE = re.compile(r"\bBid\s*Price\s*:", re.IGNORECASE)
+_ASK_PRICE_RE = re.compile(r"\bAsk\s*Price\s*:", re.IGNORECASE)
+_DATE_RE = re.compile(r'\d{1,2}-\d{1,2}-\d{4}')
+_NUM_RE = re.compile(r'\d+\.?\d*')
+_RATE_DEC_PREFIX_RE = re.compile(r'\d{2},\d{3}\.\d{2}')
+_RATE_ANY_RE = re.compile(r'\b\d{2},\d{3}(?:\.\d{2})?\b')
+_TERM_M_RE = re.compile(r'(\d+)M')
 
 class WooriProcessor(BaseBankProcessor):
     def __init__(self):
         super().__init__(bank_name="WOORI")
     
     def parse_email(self, email_text: str):
-        df_forward = self._parse_forward(email_text)
-        df_spot = self._parse_spot(email_text)
-        df_central = self._build_central_bank(email_text)
+        # Strip non-ASCII once up front; every sub-parser reuses the cleaned
+        # text (C-level codec scrub, no regex engine)
+        clean_text = scrub_non_ascii(email_text)
+        spot_text, fwd_text = self._split_sections(clean_text)
+        df_forward = self._parse_forward(fwd_text)
+        df_spot = self._parse_spot(spot_text)
+        df_central = self._build_central_bank(clean_text)
         return df_forward, df_spot, df_central
+
+    # The forward table is ~6 terms x 2 sides; 8 KiB comfortably covers it
+    # while keeping trailing signatures/disclaimers out of every later regex
+    _FWD_WINDOW = 8192
+
+    def _split_sections(self, text: str):
+        """Locate the Spot and Forward sections with a single header scan"""
+        # The headers are fixed ASCII phrases, so a literal find on one
+        # lowercased copy beats the regex engine; regexes stay as fallback
+        # for unusual spacing or ordering. Sections are sliced to bounded
+        # windows so sub-parsers never rescan the rest of the email
+        low = text.lower()
+        i = low.find("spot exchange rate")
+        j = low.find("forward exchange rates")
+        if i >= 0 and j >= 0:
+            spot_first = i < j
+            i += 18
+            if low.startswith("s", i):  # optional plural as in rates?
+                i += 1
+            k = j + 22
+            return (text[i:j] if spot_first else text[i:i + self._FWD_WINDOW],
+                    text[k:k + self._FWD_WINDOW])
+        m = _SECTIONS_RE.search(text)
+        if m:
+            return (text[m.start('spot'):m.end('spot')],
+                    text[m.end():m.end() + self._FWD_WINDOW])
+        # Degenerate layouts (e.g. forward quoted before spot): bound each
+        # section by the other header only when it actually follows it,
+        # otherwise fall back to a fixed window
+        spot_m = _SPOT_HDR_RE.search(text)
+        fwd_m = _FWD_HDR_RE.search(text)
+        spot_text = None
+        if spot_m:
+            end = (fwd_m.start() if fwd_m and fwd_m.start() > spot_m.end()
+                   else spot_m.end() + self._FWD_WINDOW)
+            spot_text = text[spot_m.end():end]
+        fwd_text = text[fwd_m.end():fwd_m.end() + self._FWD_WINDOW] if fwd_m else None
+        return spot_text, fwd_text
     
     def _to_woori_int(self, s) -> int:
         """Convert Woori rate format to int (handles commas and decimals)"""
         if s is None or str(s).strip() == '':
             return None
         # Woori uses format like 26,449.32 -> 26449 or 26,562 -> 26562
-        return int(float(str(s).replace(',', '')))
+        # Slice off the decimal part directly; the float round-trip
+        # allocated an intermediate just to truncate it again
+        return int(str(s).replace(',', '').split('.', 1)[0])
     
-    def _parse_forward(self, email_text: str) -> pd.DataFrame:
-        """Parse Woori Forward Exchange Rates"""
-        out_cols = self.get_standard_columns()['forward']
-        
-        # Find forward section
-        root = re.split(r"(?i)forward\s+exchange\s+rates", email_text, maxsplit=1)
-        if len(root) < 2:
-            return pd.DataFrame(columns=out_cols)
-        tail = root[1]
-        
-        # Split by Bid Price and Ask Price sections
-        bid_parts = re.split(r"(?i)\bBid\s*Price\s*:", tail, maxsplit=1)
-        if len(bid_parts) < 2:
-            return pd.DataFrame(columns=out_cols)
-        
-        after_bid = bid_parts[1]
-        ask_parts = re.split(r"(?i)\bAsk\s*Price\s*:", after_bid, maxsplit=1)
-        
-        bid_text = ask_parts[0]
-        ask_text = ask_parts[1] if len(ask_parts) > 1 else ""
-        
-        rows = []
-        rows += self._parse_woori_forward_side(bid_text, "Bid")
-        rows += self._parse_woori_forward_side(ask_text, "Ask")
-        
-        if not rows:
-            return pd.DataFrame(columns=out_cols)
+    def _parse_forward(self, tail) -> pd.DataFrame:
+        """Parse Woori Forward Exchange Rates (tail = text after the header)"""
+        out_cols = self._std_cols['forward']
+        if tail is None:
+            return self._empty_forward_df
+
+        # Slice out the Bid Price and Ask Price sections - literal find on a
+        # lowercased copy, with the regexes as fallback for odd spacing
+        low = tail.lower()
+        # Fast path: no "bid price" anywhere in the (already bounded) window
+        # means no forward table - bail before invoking the regex engine
+        if "bid price" not in low:
+            return self._empty_forward_df
+        b = low.find("bid price:")
+        if b >= 0:
+            b += 10
+        else:
+            bid_m = _BID_PRICE_RE.search(tail)
+            if not bid_m:
+                return self._empty_forward_df
+            b = bid_m.end()
+        after_bid = tail[b:]
+        a = low.find("ask price:", b)
+        if a >= 0:
+            bid_text = tail[b:a]
+            ask_text = tail[a + 10:]
+        else:
+            ask_m = _ASK_PRICE_RE.search(after_bid)
+            bid_text = after_bid[:ask_m.start()] if ask_m else after_bid
+            ask_text = after_bid[ask_m.end():] if ask_m else ""
         
-        df = pd.DataFrame(rows)
-        df = df.sort_values(["Bid/Ask", "Trading date", "Term (days)"]).reset_index(drop=True)
-        df.insert(0, "No.", range(1, len(df) + 1))
-        return df
+        # Merge the two columnar accumulators column-wise (SoA) - pandas gets
+        # a clean dict of lists instead of re-hashing 12 keys per row dict
+        bid = self._parse_woori_forward_side(bid_text, "Bid")
+        ask = self._parse_woori_forward_side(ask_text, "Ask")
+        data = {k: bid[k] + ask[k] for k in bid}
+
+        if not data["Bid/Ask"]:
+            return self._empty_forward_df
+
+        # Sort once with numpy before the frame exists - sort_values would
+        # copy every column and reset_index/insert would each reblock;
+        # lexsort keys run last-to-first, so Bid/Ask is the primary key
+        n = len(data["Bid/Ask"])
+        order = np.lexsort((np.asarray(data["Term (days)"]),
+                            np.asarray(data["Trading date"]),
+                            np.asarray(data["Bid/Ask"])))
+
+        # Convert the collected NN,NNN.NN rate strings in one vectorized pass
+        # instead of a Python _to_woori_int call per row
+        fwd_rates = (pd.Series(data["Forward Exchange rate"])
+                     .str.replace(',', '', regex=False)
+                     .astype('float64').astype('int64').to_numpy())
+
+        int_cols = ("Spot Exchange rate", "Term (days)", "Term (lookup)")
+        cols = {"No.": np.arange(1, n + 1, dtype=np.int64)}
+        for name, values in data.items():
+            if name == "Forward Exchange rate":
+                cols[name] = fwd_rates[order]
+            elif name in int_cols:
+                cols[name] = np.asarray(values, dtype=np.int64)[order]
+            else:
+                cols[name] = np.asarray(values, dtype=object)[order]
+        # Low-cardinality string columns as categoricals - int codes instead
+        # of object pointers ("Ask" < "Bid" keeps the lexical sort order)
+        cols["Bid/Ask"] = pd.Categorical(cols["Bid/Ask"], categories=["Ask", "Bid"])
+        cols["Bank"] = pd.Categorical(cols["Bank"])
+
+        return pd.DataFrame(cols, columns=self._fwd_cols)
     
-    def _parse_woori_forward_side(self, text: str, side: str) -> list:
-        """Parse Woori forward side (Bid or Ask)"""
-        rows = []
-        
-        # Clean unicode and split into lines
-        clean_text = re.sub(r'[^\x00-\x7F]+', ' ', text)
-        lines = [line.strip() for line in clean_text.split('\n') if line.strip()]
-        
+    def _parse_woori_forward_side(self, text: str, side: str) -> dict:
+        """Parse Woori forward side (Bid or Ask) into columnar lists"""
+        cols = {c: [] for c in self._fwd_cols[1:]}  # all but "No."
+
+        # Split into lines (text already unicode-cleaned in parse_email)
+        lines = [line.strip() for line in text.split('\n') if line.strip()]
+
+        # Classify every line once up front (1=date, 2=term, 3=gap, 4=rate);
+        # the assembly loop below reads the precomputed tags instead of
+        # re-running three regex checks per candidate line
+        kinds = []
+        for ln in lines:
+            if _DATE_RE.match(ln):
+                kinds.append(1)
+            elif "M" in ln and "(" in ln:
+                kinds.append(2)
+            elif _NUM_RE.match(ln) and "." in ln and not "," in ln:
+                kinds.append(3)
+            elif _RATE_DEC_PREFIX_RE.match(ln):
+                kinds.append(4)
+            else:
+                kinds.append(0)
+
         # Parse rows by combining consecutive lines
         i = 0
-        while i < len(lines):
-            if re.match(r'\d{1,2}-\d{1,2}-\d{4}', lines[i]):  # Trading date line "22-08-2025"
+        n = len(lines)
+        while i < n:
+            if kinds[i] == 1:  # Trading date line "22-08-2025"
                 try:
-                    if i + 4 < len(lines):
+                    # lines[i + 1] is the value date - same string as the
+                    # trading date in Woori emails, so it is only shape-checked
+                    # (kinds == 1) to reject misaligned blocks, never parsed
+                    if i + 4 < n and kinds[i + 1] == 1:
                         trd_date_str = lines[i]  # "22-08-2025"
-                        val_date_str = lines[i + 1]  # "22-08-2025" (same in Woori format)
-                        
+
                         # Skip empty spot rate field (3rd line usually empty)
                         term_str = None
                         gap_str = None
                         fwd_str = None
-                        
+
                         # Find term, gap%, and forward rate in subsequent lines
-                        for j in range(i + 2, min(i + 6, len(lines))):
-                            line = lines[j]
-                            if "M" in line and "(" in line:
-                                term_str = line  # "1M ( )"
-                            elif re.match(r'\d+\.?\d*', line) and "." in line and not "," in line:
-                                gap_str = line  # "1.35"
-                            elif re.match(r'\d{2},\d{3}\.\d{2}', line):
-                                fwd_str = line  # "26,449.32"
+                        for j in range(i + 2, min(i + 6, n)):
+                            k = kinds[j]
+                            if k == 2:
+                                term_str = lines[j]  # "1M ( )"
+                            elif k == 3:
+                                gap_str = lines[j]  # "1.35"
+                            elif k == 4:
+                                fwd_str = lines[j]  # "26,449.32"
                         
                         if fwd_str:
-                            # Convert dates from DD-MM-YYYY format
-                            from datetime import datetime
-                            
-                            trd_date = datetime.strptime(trd_date_str, "%d-%m-%Y").date()
-                            val_date = datetime.strptime(val_date_str, "%d-%m-%Y").date()
-                            
-                            trd_date_str = trd_date.strftime("%d/%m/%Y")
-                            val_date_str = val_date.strftime("%d/%m/%Y")
-                            
+                            # Parse the trading date once; the value date line
+                            # duplicates it in Woori emails, so derive the real
+                            # value date from the term instead of re-parsing
+                            trd_date = _parse_dmy_dash(trd_date_str)
+
                             # Calculate term days and lookup (Woori seems to use same trading/value dates)
                             # We'll estimate based on term
-                            term_match = re.search(r'(\d+)M', term_str) if term_str else None
+                            term_match = _TERM_M_RE.search(term_str) if term_str else None
                             if term_match:
                                 term_months = int(term_match.group(1))
                                 term_days = term_months * 30  # Approximate
-                                
-                                # Create proper value date by adding term days
-                                from datetime import timedelta
-                                val_date = trd_date + timedelta(days=term_days)
-                                val_date_str = val_date.strftime("%d/%m/%Y")
                             else:
                                 term_months = 1
                                 term_days = 30
-                            
+
+                            val_date = trd_date + timedelta(days=term_days)
+
+                            # Format each date exactly once
+                            trd_date_str = trd_date.strftime("%d/%m/%Y")
+                            val_date_str = val_date.strftime("%d/%m/%Y")
+
                             spot_rate = 26400  # Default spot rate for Woori
-                            fwd_rate = self._to_woori_int(fwd_str)
                             gap_pct = float(gap_str) if gap_str else None
                             
-                            rows.append({
-                                "Bid/Ask": side,
-                                "Bank": self.bank_name,
-                                "Quoting date": trd_date_str,
-                                "Trading date": trd_date_str,
-                                "Value date": val_date_str,
-                                "Spot Exchange rate": spot_rate,
-                                "Gap(%)": gap_pct,
-                                "Forward Exchange rate": fwd_rate,
-                                "Term (days)": term_days,
-                                "% forward (cal)": None,  # Excel formula
-                                "Diff.": None,  # Excel formula
-                                "Term (lookup)": term_months
-                            })
+                            cols["Bid/Ask"].append(side)
+                            cols["Bank"].append(self.bank_name)
+                            cols["Quoting date"].append(trd_date_str)
+                            cols["Trading date"].append(trd_date_str)
+                            cols["Value date"].append(val_date_str)
+                            cols["Spot Exchange rate"].append(spot_rate)
+                            cols["Gap(%)"].append(gap_pct)
+                            # Raw string; converted in one vectorized
+                            # pass at DataFrame assembly
+                            cols["Forward Exchange rate"].append(fwd_str)
+                            cols["Term (days)"].append(term_days)
+                            cols["% forward (cal)"].append(None)  # Excel formula
+                            cols["Diff."].append(None)  # Excel formula
+                            cols["Term (lookup)"].append(term_months)
                         
                         i += 6  # Skip processed lines
                     else:
@@ -135,31 +255,34 @@ class WooriProcessor(BaseBankProcessor):
                     i += 1
             else:
                 i += 1
-        
-        return rows
-    
-    def _parse_spot(self, email_text: str) -> pd.DataFrame:
-        """Parse Woori Spot Exchange Rates"""
-        out_cols = self.get_standard_columns()['spot']
-        
-        # Find spot section
-        parts = re.split(r"(?i)spot\s+exchange\s+rates?", email_text, maxsplit=1)
-        if len(parts) < 2:
-            return pd.DataFrame(columns=out_cols)
-        
-        spot_section = parts[1]
-        clean_section = re.sub(r'[^\x00-\x7F]+', ' ', spot_section)
-        
-        # Extract rates from spot section
-        rates_decimal = re.findall(r'\b\d{2},\d{3}\.\d{2}\b', clean_section)
-        rates_simple = re.findall(r'\b\d{2},\d{3}\b', clean_section)
+
+        return cols
+
+    def _parse_spot(self, clean_section) -> pd.DataFrame:
+        """Parse Woori Spot Exchange Rates (section pre-sliced by caller)"""
+        out_cols = self._std_cols['spot']
+        if clean_section is None:
+            return self._empty_spot_df
+
+        # Extract rates in one combined scan, still preferring the decimal
+        # format over the plain comma format when both appear
+        rates_decimal = []
+        rates_simple = []
+        for m in _RATE_ANY_RE.finditer(clean_section):
+            tok = m.group()
+            (rates_decimal if '.' in tok else rates_simple).append(tok)
         
         spot_rates = rates_decimal if rates_decimal else rates_simple
         
         if len(spot_rates) >= 6:
+            # Convert all six rates in one vectorized pass instead of calling
+            # _to_woori_int per value
+            ints = (pd.Series(spot_rates[:6])
+                    .str.replace(',', '', regex=False)
+                    .astype('float64').astype('int64').to_numpy())
             # Assume structure: bid (low, high, close), ask (low, high, close)
-            bid_rates = spot_rates[:3]
-            ask_rates = spot_rates[3:6]
+            bid_rates = ints[:3]
+            ask_rates = ints[3:6]
             
             rows = []
             for i, (side, rates) in enumerate([("Bid", bid_rates), ("Ask", ask_rates)]):
@@ -169,21 +292,15 @@ class WooriProcessor(BaseBankProcessor):
                         "Bid/Ask": side,
                         "Bank": self.bank_name,
                         "Quoting date": "25/08/2025",
-                        "Lowest rate of preceeding week": self._to_woori_int(rates[0]),
-                        "Highest rate of preceeding week": self._to_woori_int(rates[1]),
-                        "Closing rate of Friday (last week)": self._to_woori_int(rates[2])
+                        "Lowest rate of preceeding week": rates[0],
+                        "Highest rate of preceeding week": rates[1],
+                        "Closing rate of Friday (last week)": rates[2]
                     })
             
             return pd.DataFrame(rows, columns=out_cols)
         
-        return pd.DataFrame(columns=out_cols)
+        return self._empty_spot_df
     
     def _build_central_bank(self, email_text: str) -> pd.DataFrame:
         """Build Central Bank rate stub for Woori"""
-        out_cols = self.get_standard_columns()['central']
-        return pd.DataFrame([{
-            "No.": 1,
-            "Bank": self.bank_name,
-            "Quoting date": "25/08/2025",
-            "Central Bank Rate": None
-        }], columns=out_cols)
\ No newline at end of file
+        return self._central_stub("25/08/2025")
\ No newline at end of file
@@ -15,7 +15,9 @@ This will:
    - CentralBank: Central bank rates from all banks
 """
 
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List
 
@@ -37,6 +39,30 @@ from banks.uobv.processor import UOBVProcessor
 from output.merger import OutputMerger
 
 
+# Processor classes by bank name; module-level so worker processes can
+# construct them after pickling just the bank name and email text
+PROCESSOR_CLASSES = {
+    'ACB': ACBProcessor,
+    'VCB': VCBProcessor,
+    'BIDV': BIDVProcessor,
+    'TCB': TCBProcessor,
+    'KBANK': KBankProcessor,
+    'SC': SCProcessor,
+    'VIB': VIBProcessor,
+    'VTB': VTBProcessor,
+    'WOORI': WooriProcessor,
+    'UOB': UOBProcessor,
+    'UOBV': UOBVProcessor,
+}
+
+
+def _parse_one(bank_name: str, email_content: str):
+    """Parse one bank's email in a worker process"""
+    processor = PROCESSOR_CLASSES[bank_name]()
+    forward_df, spot_df, central_df = processor.parse_email(email_content)
+    return bank_name, forward_df, spot_df, central_df
+
+
 class MultiBankProcessor:
     """Main processor that coordinates all bank processing"""
     
@@ -44,23 +70,20 @@ class MultiBankProcessor:
         self.email_extractor = EmailExtractor()
         self.output_merger = OutputMerger()
         
-        # Initialize bank processors
-        self.processors = {
-            'ACB': ACBProcessor(),
-            'VCB': VCBProcessor(),
-            'BIDV': BIDVProcessor(),
-            'TCB': TCBProcessor(),
-            'KBANK': KBankProcessor(),
-            'SC': SCProcessor(),
-            'VIB': VIBProcessor(),
-            'VTB': VTBProcessor(),
-            'WOORI': WooriProcessor(),
-            'UOB': UOBProcessor(),
-            'UOBV': UOBVProcessor(),
-        }
+        # Processor factories; instances are built on first use so running a
+        # single bank doesn't pay the constructor cost for the other ten
+        self._factories = dict(PROCESSOR_CLASSES)
+        self._processors = {}
         
         # All banks are now implemented
         self.pending_banks = []
+
+    def _get_processor(self, bank_name: str):
+        """Return the processor for a bank, instantiating it on first use"""
+        processor = self._processors.get(bank_name)
+        if processor is None:
+            processor = self._processors.setdefault(bank_name, self._factories[bank_name]())
+        return processor
     
     def process_all_banks(self, msg_folder: str, output_file: str = "All_Banks_FX_Parsed.xlsx") -> None:
         """Process all bank MSG files and generate consolidated output"""
@@ -80,29 +103,56 @@ class MultiBankProcessor:
         print(f"Found emails from {len(emails)} banks: {', '.join(emails.keys())}")
         print("-" * 60)
         
-        # Process each bank
+        # Process banks in parallel - each email parse is independent and
+        # CPU-bound on regex, so a process pool sidesteps the GIL
         processed_count = 0
-        
-        for bank_name, email_content in emails.items():
-            print(f"Processing {bank_name}...")
-            
+        supported = {name: text for name, text in emails.items()
+                     if name in self._factories}
+
+        for bank_name in emails:
+            if bank_name not in supported:
+                print(f"  PENDING {bank_name}: No specific processor implemented yet.")
+
+        # Banks registered at runtime via add_bank_processor aren't visible to
+        # worker processes, so they parse in the parent with the lazy cache.
+        # That includes stock bank names whose factory has been overridden -
+        # only banks still mapped to the stock class go to the pool.
+        local = {name: text for name, text in supported.items()
+                 if self._factories.get(name) is not PROCESSOR_CLASSES.get(name)}
+        for bank_name, email_content in local.items():
             try:
-                if bank_name in self.processors:
-                    # Use specific processor
-                    processor = self.processors[bank_name]
-                    forward_df, spot_df, central_df = processor.parse_email(email_content)
-                    
-                    # Add results to merger
-                    self.output_merger.add_bank_results(bank_name, forward_df, spot_df, central_df)
-                    
-                    print(f"  SUCCESS {bank_name}: Forward={len(forward_df)}, Spot={len(spot_df)}, Central={len(central_df)}")
-                    processed_count += 1
-                    
-                else:
-                    print(f"  PENDING {bank_name}: No specific processor implemented yet.")
-                    
+                processor = self._get_processor(bank_name)
+                forward_df, spot_df, central_df = processor.parse_email(email_content)
+                self.output_merger.add_bank_results(bank_name, forward_df, spot_df, central_df)
+                print(f"  SUCCESS {bank_name}: Forward={len(forward_df)}, Spot={len(spot_df)}, Central={len(central_df)}")
+                processed_count += 1
             except Exception as e:
                 print(f"  ERROR {bank_name}: Error processing - {str(e)}")
+
+        pooled = {name: text for name, text in supported.items()
+                  if name not in local}
+        if pooled:
+            max_workers = min(os.cpu_count() or 1, len(pooled))
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(_parse_one, bank_name, email_content): bank_name
+                    for bank_name, email_content in pooled.items()
+                }
+
+                # Consume in submission order so the merged rows come out in
+                # the same deterministic order as the old sequential loop
+                for future, bank_name in futures.items():
+                    try:
+                        bank_name, forward_df, spot_df, central_df = future.result()
+
+                        # Add results to merger
+                        self.output_merger.add_bank_results(bank_name, forward_df, spot_df, central_df)
+
+                        print(f"  SUCCESS {bank_name}: Forward={len(forward_df)}, Spot={len(spot_df)}, Central={len(central_df)}")
+                        processed_count += 1
+
+                    except Exception as e:
+                        print(f"  ERROR {bank_name}: Error processing - {str(e)}")
         
         print("-" * 60)
         
@@ -117,14 +167,16 @@ class MultiBankProcessor:
     
     def add_bank_processor(self, bank_name: str, processor):
         """Add a new bank processor (for future expansion)"""
-        self.processors[bank_name.upper()] = processor
-        if bank_name.upper() in self.pending_banks:
-            self.pending_banks.remove(bank_name.upper())
-    
+        name = bank_name.upper()
+        self._processors[name] = processor
+        self._factories[name] = type(processor)
+        if name in self.pending_banks:
+            self.pending_banks.remove(name)
+
     def list_supported_banks(self) -> None:
         """List currently supported banks"""
         print("Bank Processing Status:")
-        print(f"Implemented: {', '.join(self.processors.keys())}")
+        print(f"Implemented: {', '.join(self._factories.keys())}")
         print(f"Pending: {', '.join(self.pending_banks)}")
 
 
@@ -4,9 +4,11 @@ Output Merger - Combines results from all banks into single Excel output
 Maintains consistent 3-sheet structure (Forward/Spot/CentralBank)
 """
 
+import numpy as np
 import pandas as pd
 from typing import List, Tuple, Dict, Any
 from datetime import datetime
+from xlsxwriter.utility import xl_col_to_name
 
 
 class OutputMerger:
@@ -17,15 +19,18 @@ class OutputMerger:
         self.spot_data = []
         self.central_data = []
     
-    def add_bank_results(self, bank_name: str, forward_df: pd.DataFrame, 
+    def add_bank_results(self, bank_name: str, forward_df: pd.DataFrame,
                         spot_df: pd.DataFrame, central_df: pd.DataFrame) -> None:
         """Add results from a single bank"""
+        # Normalize to Arrow-backed dtypes at ingestion so merge_all_results
+        # concatenates aligned chunked arrays instead of promoting each
+        # bank's object-dtype blocks during pd.concat
         if not forward_df.empty:
-            self.forward_data.append(forward_df)
+            self.forward_data.append(forward_df.convert_dtypes(dtype_backend="pyarrow"))
         if not spot_df.empty:
-            self.spot_data.append(spot_df)
+            self.spot_data.append(spot_df.convert_dtypes(dtype_backend="pyarrow"))
         if not central_df.empty:
-            self.central_data.append(central_df)
+            self.central_data.append(central_df.convert_dtypes(dtype_backend="pyarrow"))
     
     def merge_all_results(self) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
         """Merge all bank results into consolidated DataFrames"""
@@ -33,8 +38,9 @@ class OutputMerger:
         # Merge Forward data
         if self.forward_data:
             merged_forward = pd.concat(self.forward_data, ignore_index=True)
-            # Re-number sequentially
-            merged_forward['No.'] = range(1, len(merged_forward) + 1)
+            # Re-number sequentially - a ready int64 array writes in one
+            # block instead of materializing a range object element-wise
+            merged_forward['No.'] = np.arange(1, len(merged_forward) + 1)
         else:
             merged_forward = pd.DataFrame(columns=[
                 "No.", "Bid/Ask", "Bank", "Quoting date", "Trading date", "Value date",
@@ -45,7 +51,7 @@ class OutputMerger:
         # Merge Spot data
         if self.spot_data:
             merged_spot = pd.concat(self.spot_data, ignore_index=True)
-            merged_spot['No.'] = range(1, len(merged_spot) + 1)
+            merged_spot['No.'] = np.arange(1, len(merged_spot) + 1)
         else:
             merged_spot = pd.DataFrame(columns=[
                 "No.", "Bid/Ask", "Bank", "Quoting date",
@@ -56,7 +62,7 @@ class OutputMerger:
         # Merge Central Bank data
         if self.central_data:
             merged_central = pd.concat(self.central_data, ignore_index=True)
-            merged_central['No.'] = range(1, len(merged_central) + 1)
+            merged_central['No.'] = np.arange(1, len(merged_central) + 1)
         else:
             merged_central = pd.DataFrame(columns=[
                 "No.", "Quoting date", "Central Bank Rate"
@@ -68,66 +74,104 @@ class OutputMerger:
         """Export merged results to Excel with formulas"""
         forward_df, spot_df, central_df = self.merge_all_results()
         
-        # Ensure date columns are properly formatted
+        # Ensure date columns are properly formatted; keep them as
+        # datetime64 so the column stays in a dense buffer and the writer's
+        # datetime_format does the rendering (cache=True folds duplicate
+        # date strings into a single parse)
         for c in ["Quoting date", "Trading date", "Value date"]:
             if c in forward_df.columns:
-                forward_df[c] = pd.to_datetime(forward_df[c], dayfirst=True, errors="coerce").dt.date
+                forward_df[c] = pd.to_datetime(forward_df[c], dayfirst=True,
+                                               errors="coerce", cache=True)
         
-        with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
+        # xlsxwriter streams each sheet in a single pass instead of keeping
+        # an openpyxl Cell object per cell; formulas and number formats are
+        # written inline right after the data
+        with pd.ExcelWriter(output_path, engine="xlsxwriter",
+                            date_format="dd/mm/yyyy",
+                            datetime_format="dd/mm/yyyy") as writer:
             forward_df.to_excel(writer, sheet_name="Forward", index=False)
             spot_df.to_excel(writer, sheet_name="Spot", index=False)
             central_df.to_excel(writer, sheet_name="CentralBank", index=False)
-            
+
             # Add Excel formulas to Forward sheet
             if not forward_df.empty:
-                self._add_excel_formulas(writer.book["Forward"], forward_df)
+                self._add_excel_formulas(writer, forward_df)
         
+        # Bank counts computed once into locals; .unique().size skips the
+        # extra bookkeeping nunique does on top of the hash pass
+        n_banks_fwd = (forward_df['Bank'].unique().size
+                       if 'Bank' in forward_df.columns and not forward_df.empty else 0)
+        n_banks_spot = (spot_df['Bank'].unique().size
+                        if 'Bank' in spot_df.columns and not spot_df.empty else 0)
+
         print(f"SUCCESS: Merged results exported to: {output_path}")
         print(f"Summary:")
-        print(f"  - Forward: {len(forward_df)} rows from {forward_df['Bank'].nunique() if 'Bank' in forward_df.columns and not forward_df.empty else 0} banks")
-        print(f"  - Spot: {len(spot_df)} rows from {spot_df['Bank'].nunique() if 'Bank' in spot_df.columns and not spot_df.empty else 0} banks")
+        print(f"  - Forward: {len(forward_df)} rows from {n_banks_fwd} banks")
+        print(f"  - Spot: {len(spot_df)} rows from {n_banks_spot} banks")
         print(f"  - Central: {len(central_df)} rows")
     
-    def _add_excel_formulas(self, worksheet, forward_df: pd.DataFrame) -> None:
-        """Add Excel formulas to Forward sheet"""
-        headers = [cell.value for cell in next(worksheet.iter_rows(min_row=1, max_row=1))]
-        col = {name: i+1 for i, name in enumerate(headers)}
-        
-        # Format date columns
-        for r in range(2, worksheet.max_row + 1):
-            for name in ["Quoting date", "Trading date", "Value date"]:
-                if name in col:
-                    worksheet.cell(row=r, column=col[name]).number_format = "dd/mm/yyyy"
-        
-        # Insert formulas
-        for r in range(2, worksheet.max_row + 1):
-            if all(name in col for name in ["Spot Exchange rate", "Forward Exchange rate", "Term (days)", "Gap(%)"]):
-                c_spot = worksheet.cell(row=r, column=col["Spot Exchange rate"]).coordinate
-                c_fwd = worksheet.cell(row=r, column=col["Forward Exchange rate"]).coordinate
-                c_term = worksheet.cell(row=r, column=col["Term (days)"]).coordinate
-                c_gap = worksheet.cell(row=r, column=col["Gap(%)"]).coordinate
-                
+    def _add_excel_formulas(self, writer, forward_df: pd.DataFrame) -> None:
+        """Add Excel formulas to Forward sheet (xlsxwriter, 0-based rows)"""
+        worksheet = writer.sheets["Forward"]
+        pct_fmt = writer.book.add_format({"num_format": "0.000%"})
+
+        headers = list(forward_df.columns)
+        col = {name: i for i, name in enumerate(headers)}
+
+        # Percent format applied once per column instead of once per cell;
+        # cells without an explicit format pick up the column style
+        for name in ("% forward (cal)", "Diff."):
+            if name in col:
+                worksheet.set_column(col[name], col[name], None, pct_fmt)
+
+        # Membership and column-index lookups hoisted out of the row loop -
+        # if a column exists for the header it exists for every row
+        have_rate_block = all(name in col for name in
+                              ("Spot Exchange rate", "Forward Exchange rate",
+                               "Term (days)", "Gap(%)"))
+        have_date_block = all(name in col for name in
+                              ("Trading date", "Value date"))
+        # Column letters resolved once; per-row coordinates are then plain
+        # f-strings instead of a helper call per referenced cell
+        letters = {name: xl_col_to_name(idx) for name, idx in col.items()}
+        if have_rate_block:
+            let_spot = letters["Spot Exchange rate"]
+            let_fwd = letters["Forward Exchange rate"]
+            let_term = letters["Term (days)"]
+            let_gap = letters["Gap(%)"]
+            let_pct = letters["% forward (cal)"]
+            col_pct = col["% forward (cal)"]
+            col_diff = col["Diff."]
+        if have_date_block:
+            let_trd = letters["Trading date"]
+            let_val = letters["Value date"]
+            col_lookup = col["Term (lookup)"]
+
+        # Insert formulas (the date columns are already handled by the
+        # writer's date_format)
+        for r in range(1, len(forward_df) + 1):
+            a1_row = r + 1  # xlsxwriter rows are 0-based, A1 rows are not
+            if have_rate_block:
+                c_spot = f"{let_spot}{a1_row}"
+                c_fwd = f"{let_fwd}{a1_row}"
+                c_term = f"{let_term}{a1_row}"
+                c_gap = f"{let_gap}{a1_row}"
+
                 # % forward (cal) = ((Fwd - Spot) * 365) / (Spot * Term(days))
-                worksheet.cell(row=r, column=col["% forward (cal)"]).value = (
+                worksheet.write_formula(
+                    r, col_pct,
                     f"=IFERROR(({c_fwd}-{c_spot})*365/({c_spot}*{c_term}),0)"
                 )
-                
+
                 # Diff. = % forward (cal) - Gap(%)/100
-                pct_cell = worksheet.cell(row=r, column=col["% forward (cal)"]).coordinate
-                worksheet.cell(row=r, column=col["Diff."]).value = f"=IFERROR({pct_cell}-{c_gap}/100,0)"
-            
-            if all(name in col for name in ["Trading date", "Value date"]):
-                c_trd = worksheet.cell(row=r, column=col["Trading date"]).coordinate
-                c_val = worksheet.cell(row=r, column=col["Value date"]).coordinate
-                
-                # Term (lookup) = ROUND(YEARFRAC(Trading, Value)*12,0)
-                worksheet.cell(row=r, column=col["Term (lookup)"]).value = (
-                    f"=ROUND(YEARFRAC({c_trd},{c_val})*12,0)"
+                worksheet.write_formula(
+                    r, col_diff,
+                    f"=IFERROR({let_pct}{a1_row}-{c_gap}/100,0)"
                 )
-        
-        # Number formats
-        for r in range(2, worksheet.max_row + 1):
-            if "% forward (cal)" in col:
-                worksheet.cell(row=r, column=col["% forward (cal)"]).number_format = "0.000%"
-            if "Diff." in col:
-                worksheet.cell(row=r, column=col["Diff."]).number_format = "0.000%"
\ No newline at end of file
+
+            if have_date_block:
+                # Term (lookup) = ROUND(YEARFRAC(Trading, Value)*12,0)
+                worksheet.write_formula(
+                    r, col_lookup,
+                    f"=ROUND(YEARFRAC({let_trd}{a1_row},{let_val}{a1_row})*12,0)"
+                )
\ No newline at end of file
@@ -8,17 +8,16 @@ import os
 
 def save_emails_to_files():
     extractor = EmailExtractor()
-    emails = extractor.extract_all_from_folder('C:/Users/ADMIN/Downloads/W4_Aug_25')
-    
+
     # Create output directory
     output_dir = 'email_samples'
     os.makedirs(output_dir, exist_ok=True)
-    
-    # Save each email to a file
-    for bank, content in emails.items():
+
+    # Stream each email to its file - only one email is in memory at a time
+    for bank, chunks in extractor.iter_emails_from_folder('C:/Users/ADMIN/Downloads/W4_Aug_25'):
         filename = f"{output_dir}/{bank}_email.txt"
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(content)
+        with open(filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.writelines(chunks)
         print(f"Saved {bank} email to: {filename}")
 
 if __name__ == "__main__":
@@ -4,32 +4,49 @@ Email extraction utilities for MSG files
 """
 
 import extract_msg
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from utils.msg_processor import EmailData
+
+
+@lru_cache(maxsize=128)
+def _extract_body(msg_file_path: str, mtime_ns: int) -> str:
+    """Cached body extraction keyed by (path, mtime) so re-reading the
+    same unchanged MSG file never re-parses the OLE container"""
+    msg = extract_msg.Message(msg_file_path)
+    return msg.body or ""
 
 
 class EmailExtractor:
     """Extract email content from MSG files"""
-    
+
     def __init__(self):
         pass
-    
-    def extract_from_msg(self, msg_file_path: str) -> Optional[str]:
-        """Extract email body text from MSG file"""
+
+    def extract_from_msg(self, source: Union[str, EmailData]) -> Optional[str]:
+        """Extract email body text from an MSG file path, or reuse the body
+        from an already-parsed EmailData"""
+        # Pipelines that ran MSGProcessor first hand the parsed record over
+        # instead of paying for a second OLE parse of the same file
+        if isinstance(source, EmailData):
+            return source.body
+
         try:
-            msg_path = Path(msg_file_path)
+            msg_path = Path(source)
             if not msg_path.exists() or msg_path.suffix.lower() != '.msg':
-                print(f"ERROR: Invalid MSG file: {msg_file_path}")
+                print(f"ERROR: Invalid MSG file: {source}")
                 return None
-            
-            msg = extract_msg.Message(msg_file_path)
-            email_body = msg.body or ""
-            
+
+            email_body = _extract_body(str(source), msg_path.stat().st_mtime_ns)
+
             print(f"SUCCESS: Extracted email from: {msg_path.name}")
             return email_body
-            
+
         except Exception as e:
-            print(f"ERROR extracting {msg_file_path}: {str(e)}")
+            print(f"ERROR extracting {source}: {str(e)}")
             return None
     
     def extract_all_from_folder(self, folder_path: str) -> Dict[str, str]:
@@ -40,16 +57,45 @@ class EmailExtractor:
             return {}
         
         results = {}
-        msg_files = list(folder.glob("*.msg"))
-        
+        msg_files = self._scan_msg_files(folder)
+
         print(f"Found {len(msg_files)} MSG files in {folder_path}")
-        
-        for msg_file in msg_files:
-            bank_name = msg_file.stem.upper()  # ACB.msg -> ACB
-            email_content = self.extract_from_msg(str(msg_file))
-            
+
+        for name, msg_path in msg_files:
+            bank_name = name[:-4].upper()  # ACB.msg -> ACB
+            email_content = self.extract_from_msg(msg_path)
+
             if email_content:
                 results[bank_name] = email_content
         
         print(f"Successfully extracted {len(results)} emails")
-        return results
\ No newline at end of file
+        return results
+
+    def iter_emails_from_folder(self, folder_path: str,
+                                chunk_size: int = 1 << 20) -> Iterator[Tuple[str, Iterable[str]]]:
+        """Yield (bank_name, text_chunks) per MSG file without holding all
+        emails in memory at once; each email is released before the next
+        file is opened"""
+        folder = Path(folder_path)
+        if not folder.exists() or not folder.is_dir():
+            print(f"ERROR: Folder not found: {folder_path}")
+            return
+
+        msg_files = self._scan_msg_files(folder)
+        print(f"Found {len(msg_files)} MSG files in {folder_path}")
+
+        for name, msg_path in msg_files:
+            bank_name = name[:-4].upper()  # ACB.msg -> ACB
+            email_content = self.extract_from_msg(msg_path)
+
+            if email_content:
+                yield bank_name, (email_content[i:i + chunk_size]
+                                  for i in range(0, len(email_content), chunk_size))
+
+    @staticmethod
+    def _scan_msg_files(folder: Path) -> List[Tuple[str, str]]:
+        """(name, path) pairs for MSG files - os.scandir with a suffix check
+        instead of glob's per-entry fnmatch and Path construction"""
+        return [(entry.name, entry.path) for entry in os.scandir(folder)
+                if entry.is_file(follow_symlinks=False)
+                and entry.name.lower().endswith('.msg')]
\ No newline at end of file